@@ -1,3 +1,4 @@
+import logging
 import pandas as pd
 import sys
 from rich.console import Console
@@ -8,6 +9,9 @@ from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import print as rprint
 from src.eda.full_eda import full_eda
+from src.eda.planner import MemoryBudgetExceeded, MIN_SAMPLE_ROWS
+from src.reporting.render import render_insights, write_html_report
+from src.reporting.report import load_report
 from src.target_detection import detect_target_variable, suggest_target_variables
 
 console = Console()
@@ -18,6 +22,12 @@ def main():
     console.print(Panel("[bold blue]SMART EDA LIBRARY[/bold blue]", expand=False))
     console.print("[bold green]AUTO EDA STARTED[/bold green]\n")
 
+    # Memory budget, e.g. --memory-budget=8GB: plan the run to fit it
+    memory_budget = next((arg.split("=", 1)[1] for arg in sys.argv[1:]
+                          if arg.startswith("--memory-budget=")), None)
+    if memory_budget:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # 1. Load your dataset here
     try:
         with Progress(
@@ -26,7 +36,9 @@ def main():
             transient=True,
         ) as progress:
             progress.add_task(description="Loading dataset...", total=None)
-            df = pd.read_csv("data.csv")
+            # Under a memory budget only a sample is loaded for choosing the
+            # target; full_eda then loads or streams the file as planned
+            df = pd.read_csv("data.csv", nrows=MIN_SAMPLE_ROWS if memory_budget else None)
 
         console.print("[bold green][OK][/bold green] Dataset loaded successfully.", style="green")
     except FileNotFoundError:
@@ -57,7 +69,9 @@ def main():
     # Get target column from command line argument, auto-detection, or user input
     if len(sys.argv) > 1:
         # Remove viz and auto flags from sys.argv if present to get the actual target
-        args = [arg for arg in sys.argv[1:] if arg not in ["--viz", "-v", "--auto", "-a"]]
+        args = [arg for arg in sys.argv[1:] if arg not in ["--viz", "-v", "--auto", "-a", "--report", "-r",
+                                                           "--no-fits"]
+                and not arg.startswith("--memory-budget=")]
         if args and not auto_detect:
             target = args[0]
             console.print(f"\n[bold blue]Using target column from command line:[/bold blue] [italic]{target}[/italic]")
@@ -205,36 +219,48 @@ def main():
         viz_choice = Prompt.ask("\n[bold]Would you like to generate visualizations?[/bold] ([blue]y[/blue]/[red]n[/red])", default="n")
         cmd_generate_viz = viz_choice.lower() in ['y', 'yes', 'true', '1']
 
+    # Persist insights as a report file and HTML page
+    save_report = "--report" in sys.argv or "-r" in sys.argv
+
+    # Skip distribution fitting, the slowest stage on wide tables
+    fit_dists = "--no-fits" not in sys.argv
+
     # Run automated EDA with progress bar
     console.print(f"\n[bold blue]Running full EDA on target:[/bold blue] [italic]{target}[/italic]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        progress.add_task(description="Performing EDA analysis...", total=None)
-        clean_df, insights = full_eda(df, target=target, generate_viz=cmd_generate_viz)
+    if memory_budget:
+        # Let full_eda load (or stream) the whole file within the budget
+        df = "data.csv"
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            transient=True,
+        ) as progress:
+            progress.add_task(description="Performing EDA analysis...", total=None)
+            clean_df, insights = full_eda(df, target=target, generate_viz=cmd_generate_viz,
+                                          report_path="eda_report.jsonl" if save_report else None,
+                                          memory_budget=memory_budget, distribution_fits=fit_dists)
+    except MemoryBudgetExceeded as e:
+        console.print(f"[bold red][ERROR][/bold red] [red]{e}[/red]")
+        return
 
     # 4. Display Insights in a nice format
     console.print("\n[bold green]EDA Insights Summary:[/bold green]\n")
+    render_insights(insights, console)
 
-    for key, value in insights.items():
-        panel_title = f"[bold]{key.upper()}[/bold]"
-        if isinstance(value, dict):
-            # Format dictionary nicely
-            formatted_value = "\n".join([f"{k}: {v}" for k, v in value.items()])
-            console.print(Panel(formatted_value, title=panel_title, border_style="blue"))
-        elif hasattr(value, '__len__') and len(value) > 0:
-            # Format pandas Series/DataFrame
-            console.print(Panel(str(value), title=panel_title, border_style="blue"))
-        else:
-            # Plain text for other types
-            console.print(Panel(str(value), title=panel_title, border_style="blue"))
+    if save_report:
+        # The report records the plots this run wrote; the directory may hold stale ones
+        write_html_report(load_report("eda_report.jsonl"), "eda_report.html")
+        console.print("\n[bold green][OK] Report saved as:[/bold green] [italic]eda_report.jsonl[/italic], [italic]eda_report.html[/italic]")
 
-    # 5. Save cleaned dataset
-    clean_df.to_csv("cleaned_output.csv", index=False)
-    console.print("\n[bold green][OK] Cleaned dataset saved as:[/bold green] [italic]cleaned_output.csv[/italic]")
+    # 5. Save cleaned dataset (not materialized when the file was profiled in chunks)
+    if clean_df is not None:
+        clean_df.to_csv("cleaned_output.csv", index=False)
+        console.print("\n[bold green][OK] Cleaned dataset saved as:[/bold green] [italic]cleaned_output.csv[/italic]")
+    else:
+        console.print("\n[yellow]Dataset was profiled in chunks; no cleaned copy was written.[/yellow]")
 
     console.print("\n[bold green][COMPLETE] EDA Complete![/bold green]\n")
 
@@ -1,14 +1,129 @@
+import numpy as np
 import pandas as pd
 
 
-def missing_percentage(df):
+class NullBitsets:
+    """
+    Null masks of a dataframe packed into one bitset per column.
+
+    Each column's mask costs one bit per row instead of a byte (or a full
+    boolean frame). Null counts come from popcounts, co-missingness from
+    bitwise AND of column bitsets.
+    """
+
+    def __init__(self, columns, bits, n_rows):
+        self.columns = list(columns)
+        self.bits = bits
+        self.n_rows = n_rows
+        self._counts = None
+
+    @classmethod
+    def from_frame(cls, df):
+        """Pack the null mask of every column, one column at a time."""
+        n_words = (len(df) + 63) // 64
+        bits = np.zeros((len(df.columns), n_words * 8), dtype=np.uint8)
+        for i, col in enumerate(df.columns):
+            packed = np.packbits(df[col].isnull().to_numpy())
+            bits[i, :len(packed)] = packed
+        # Word-sized view so AND/popcount process 64 rows per operation
+        return cls(df.columns, bits.view(np.uint64), len(df))
+
+    def counts(self):
+        """Null count per column (popcount of each bitset)."""
+        if self._counts is None:
+            self._counts = pd.Series(np.bitwise_count(self.bits).sum(axis=1, dtype=np.int64),
+                                     index=self.columns)
+        return self._counts
+
+    def percentages(self):
+        """Null percentage per column."""
+        return self.counts() / self.n_rows * 100 if self.n_rows else self.counts().astype(float)
+
+    def co_missing(self, include_complete=False):
+        """
+        Column-by-column co-missingness matrix.
+
+        Entry (a, b) is the number of rows where both a and b are null; the
+        diagonal holds the null counts. Columns without nulls are left out
+        unless ``include_complete`` is True.
+
+        Returns:
+            pd.DataFrame: Symmetric matrix of joint null counts
+        """
+        counts = self.counts()
+        keep = np.arange(len(self.columns)) if include_complete else np.flatnonzero(counts.to_numpy())
+        bits = self.bits[keep]
+        matrix = np.zeros((len(keep), len(keep)), dtype=np.int64)
+        for i in range(len(keep)):
+            row = np.bitwise_count(bits[i] & bits[i:]).sum(axis=1, dtype=np.int64)
+            matrix[i, i:] = row
+            matrix[i:, i] = row
+        labels = [self.columns[k] for k in keep]
+        return pd.DataFrame(matrix, index=labels, columns=labels)
+
+    def patterns(self, top=None, chunk_rows=1 << 16):
+        """
+        Frequency of distinct row-wise missing patterns.
+
+        Only columns that contain nulls take part in a pattern. Rows are
+        processed in chunks, so memory stays bounded for any row count.
+
+        Args:
+            top: Return only the ``top`` most frequent patterns (default all)
+            chunk_rows: Rows unpacked per chunk (rounded up to a multiple of 8)
+
+        Returns:
+            pd.DataFrame: One boolean column per null-bearing column (True =
+            missing), plus ``count`` and ``percentage``, most frequent first
+        """
+        counts = self.counts()
+        keep = np.flatnonzero(counts.to_numpy())
+        labels = [self.columns[k] for k in keep]
+        if not labels:
+            return pd.DataFrame({"count": [self.n_rows], "percentage": [100.0]}) if self.n_rows \
+                else pd.DataFrame(columns=["count", "percentage"])
+        bits = self.bits[keep].view(np.uint8)
+        # Chunks must start on a byte boundary of the packed masks
+        chunk_rows = max(8, -(-chunk_rows // 8) * 8)
+
+        totals = {}
+        for start in range(0, self.n_rows, chunk_rows):
+            stop = min(start + chunk_rows, self.n_rows)
+            chunk = np.unpackbits(bits[:, start // 8:(stop + 7) // 8], axis=1)[:, :stop - start]
+            # One packed key per row: bit j set when column j is null
+            keys = np.ascontiguousarray(np.packbits(chunk, axis=0).T)
+            keys = keys.view(np.dtype((np.void, keys.shape[1]))).ravel()
+            unique, freq = np.unique(keys, return_counts=True)
+            for key, n in zip(unique.tolist(), freq.tolist()):
+                totals[key] = totals.get(key, 0) + n
+
+        ordered = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        if top is not None:
+            ordered = ordered[:top]
+        keys = np.frombuffer(b"".join(k for k, _ in ordered), dtype=np.uint8).reshape(len(ordered), -1)
+        flags = np.unpackbits(keys, axis=1)[:, :len(labels)].astype(bool)
+        result = pd.DataFrame(flags, columns=labels)
+        result["count"] = [n for _, n in ordered]
+        result["percentage"] = result["count"] / self.n_rows * 100 if self.n_rows else 0.0
+        return result
+
+
+def missing_percentage(df, bitsets=None):
+    if bitsets is not None:
+        return bitsets.percentages()
     return df.isnull().mean() * 100
 
 
-def fill_missing(df, method="mean"):
-    df = df.copy()
+def fill_missing(df, method="mean", bitsets=None, inplace=False):
+    # inplace=True fills the caller's frame column by column instead of
+    # copying it whole first
+    if not inplace:
+        df = df.copy()
+    # With precomputed bitsets, columns without nulls are skipped without a scan
+    null_counts = bitsets.counts().to_dict() if bitsets is not None else None
     for col in df.columns:
-        if df[col].isnull().sum() > 0:
+        has_nulls = null_counts[col] > 0 if null_counts is not None else df[col].isnull().sum() > 0
+        if has_nulls:
             # Check if column is numeric (not string/object)
             if df[col].dtype in ['int64', 'float64', 'int32', 'float32']:
                 if method == "mean":
@@ -15,17 +15,20 @@ def detect_outliers_iqr(series):
 
 def remove_outliers_zscore(df, columns, threshold=3):
     """Remove outliers using Z-score method"""
-    df_clean = df.copy()
+    # Columns are filtered in turn, each on the rows kept so far; tracking
+    # the kept rows as a mask copies the frame once instead of per column
+    keep = np.ones(len(df), dtype=bool)
     for col in columns:
-        if col in df_clean.columns:
-            z_scores = np.abs((df_clean[col] - df_clean[col].mean()) / df_clean[col].std())
-            df_clean = df_clean[z_scores <= threshold]
-    return df_clean
+        if col in df.columns:
+            values = df[col][keep]
+            z_scores = np.abs((values - values.mean()) / values.std())
+            keep[keep] = (z_scores <= threshold).to_numpy()
+    return df[keep]
 
 
-def cap_outliers_iqr(df, columns):
+def cap_outliers_iqr(df, columns, inplace=False):
     """Cap outliers using IQR method (winsorizing)"""
-    df_capped = df.copy()
+    df_capped = df if inplace else df.copy()
     for col in columns:
         if col in df_capped.columns:
             q1 = df_capped[col].quantile(0.25)
@@ -0,0 +1,227 @@
+"""
+Coordinator/worker mode for profiling tables that are split into shards.
+
+Each worker loads its shards (files, byte or row ranges of a CSV, or dataframes),
+computes mergeable partial profiles and sends them back over a transport;
+the coordinator merges them into the same insights dict ``full_eda``
+produces. See ``profiles`` for the two-pass protocol.
+"""
+import io
+import multiprocessing
+import os
+import time
+import traceback
+from functools import reduce
+
+import pandas as pd
+
+from .profiles import shard_stats, merge_stats, plan_pass, shard_pass, merge_pass, build_insights
+from .transport import QueueTransport, dumps, loads
+
+
+def _csv_header(path):
+    # Column names as pandas reads them (duplicates already de-duplicated)
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+
+def load_shard(shard):
+    """
+    Load one shard.
+
+    Args:
+        shard: A dataframe, a CSV path, a dict ``{"path", "offset", "end"}``
+            selecting the lines in bytes ``[offset, end)`` of a CSV file
+            (as produced by ``split_csv``), or a dict ``{"path", "start",
+            "stop"}`` selecting data rows ``[start, stop)``
+
+    Returns:
+        pd.DataFrame: Shard contents
+    """
+    if isinstance(shard, pd.DataFrame):
+        return shard
+    if isinstance(shard, (str, os.PathLike)):
+        return pd.read_csv(shard)
+    header = _csv_header(shard["path"])
+    if "offset" in shard:
+        # Read only this shard's bytes; nothing before the offset is parsed
+        with open(shard["path"], "rb") as f:
+            f.seek(shard["offset"])
+            data = f.read(shard["end"] - shard["offset"])
+        if not data.strip():
+            return pd.DataFrame(columns=header)
+        return pd.read_csv(io.BytesIO(data), header=None, names=header)
+    start = shard.get("start", 0)
+    stop = shard.get("stop")
+    # An integer skip lets the parser drop lines without a set of row numbers
+    return pd.read_csv(shard["path"], skiprows=start + 1, header=None, names=header,
+                       nrows=None if stop is None else stop - start)
+
+
+def split_csv(path, n_shards):
+    """
+    Split a CSV file into ``n_shards`` byte ranges of roughly equal size.
+
+    Range boundaries are moved to the next line start, so each shard holds
+    whole rows and can be read with a single seek. Fields with embedded
+    newlines are not supported.
+    """
+    size = os.path.getsize(path)
+    bounds = []
+    with open(path, "rb") as f:
+        f.readline()
+        data_start = f.tell()
+        for i in range(n_shards + 1):
+            target = data_start + round(i * (size - data_start) / n_shards)
+            if target <= data_start or target >= size:
+                bounds.append(min(max(target, data_start), size))
+                continue
+            # Align to the start of the line containing byte `target` + 1
+            f.seek(target - 1)
+            f.readline()
+            bounds.append(f.tell())
+    return [{"path": path, "offset": bounds[i], "end": bounds[i + 1]}
+            for i in range(n_shards) if bounds[i + 1] > bounds[i]]
+
+
+def run_worker(endpoint):
+    """
+    Worker loop: answer ``stats``/``pass`` requests until told to stop.
+
+    Shards are loaded once on the first request and kept for the second
+    pass. Failures are reported to the coordinator instead of being raised.
+    """
+    channel = endpoint.connect()
+    frames = []
+    try:
+        while True:
+            message = loads(channel.recv())
+            op = message["op"]
+            if op == "stop":
+                break
+            try:
+                if op == "stats":
+                    frames = [load_shard(shard) for shard in message["shards"]]
+                    partials = [shard_stats(frame, message["sample_size"], seed)
+                                for frame, seed in zip(frames, message["seeds"])]
+                    partial = reduce(merge_stats, partials) if partials else None
+                elif op == "pass":
+                    partials = [shard_pass(frame, message["context"]) for frame in frames]
+                    partial = reduce(merge_pass, partials) if partials else None
+                else:
+                    raise ValueError(f"Unknown operation '{op}'")
+                channel.send(dumps({"op": op, "partial": partial}))
+            except Exception:
+                channel.send(dumps({"op": "error", "error": traceback.format_exc()}))
+    finally:
+        channel.close()
+
+
+# How often to check that local worker processes are still alive while waiting
+_POLL_SECONDS = 1.0
+
+
+def _check_workers(processes, worker_ids):
+    for worker_id in worker_ids:
+        if worker_id < len(processes) and not processes[worker_id].is_alive():
+            raise RuntimeError(f"Worker {worker_id} exited unexpectedly "
+                               f"(exit code {processes[worker_id].exitcode})")
+
+
+def _poll(call, timeout, processes, worker_ids):
+    """
+    Run a blocking transport call in short slices, failing fast on dead workers.
+
+    Raises:
+        TimeoutError: If ``timeout`` seconds pass without success
+        RuntimeError: If a local worker in ``worker_ids`` has exited
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        wait = _POLL_SECONDS
+        if deadline is not None:
+            wait = min(wait, deadline - time.monotonic())
+            if wait <= 0:
+                raise TimeoutError("Timed out waiting for workers")
+        try:
+            return call(wait)
+        except TimeoutError:
+            _check_workers(processes, worker_ids)
+
+
+def _gather(transport, messages, merge, timeout, processes=()):
+    for worker_id, message in enumerate(messages):
+        transport.send(worker_id, dumps(message))
+
+    partials = []
+    pending = set(range(len(messages)))
+    for _ in messages:
+        worker_id, data = _poll(transport.recv, timeout, processes, pending)
+        pending.discard(worker_id)
+        reply = loads(data)
+        if reply["op"] == "error":
+            raise RuntimeError(f"Worker {worker_id} failed:\n{reply['error']}")
+        if reply["partial"] is not None:
+            partials.append(reply["partial"])
+    return reduce(merge, partials)
+
+
+def distributed_eda(shards, target, n_workers=None, transport=None, start_workers=True,
+                    sample_size=2000, timeout=None):
+    """
+    Profile a sharded table with a coordinator and worker processes.
+
+    Args:
+        shards: List of shards (see ``load_shard``); assigned round-robin
+        target: Target column name
+        n_workers: Number of workers (default: one per shard, up to the CPU count)
+        transport: Transport instance (default ``QueueTransport``)
+        start_workers: Spawn local worker processes; set to False when
+            workers are started elsewhere against ``transport.endpoint(i)``
+            (call ``transport.open(n_workers)`` first to obtain endpoints)
+        sample_size: Per-column sample size kept for distribution fitting
+        timeout: Seconds to wait for workers to connect and for each
+            reply (default: no limit). Local workers that exit early are
+            detected either way.
+
+    Returns:
+        dict: Insights with the same keys as ``full_eda``. The cleaned
+        dataframe stays distributed and is not returned.
+    """
+    if not shards:
+        raise ValueError("At least one shard is required")
+    n_workers = n_workers or min(len(shards), os.cpu_count() or 1)
+    n_workers = min(n_workers, len(shards))
+    transport = transport or QueueTransport()
+    transport.open(n_workers)
+
+    processes = []
+    if start_workers:
+        for worker_id in range(n_workers):
+            process = multiprocessing.Process(target=run_worker, args=(transport.endpoint(worker_id),),
+                                              daemon=True)
+            process.start()
+            processes.append(process)
+
+    try:
+        _poll(transport.wait_for_workers, timeout, processes, range(n_workers))
+        stats_messages = [
+            {"op": "stats", "shards": shards[w::n_workers], "sample_size": sample_size,
+             "seeds": list(range(w, len(shards), n_workers))}
+            for w in range(n_workers)
+        ]
+        stats = _gather(transport, stats_messages, merge_stats, timeout, processes)
+        context = plan_pass(stats, target)
+        passdata = _gather(transport, [{"op": "pass", "context": context}] * n_workers,
+                           merge_pass, timeout, processes)
+        return build_insights(stats, context, passdata)
+    finally:
+        for worker_id in range(n_workers):
+            try:
+                transport.send(worker_id, dumps({"op": "stop"}))
+            except (OSError, KeyError):
+                pass
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        transport.close()
@@ -0,0 +1,511 @@
+"""
+Mergeable partial profiles for sharded EDA.
+
+Profiling runs in two passes. The first pass (``shard_stats``) reads raw
+shards and collects per-column null counts, moments, ranges, category counts
+and a bottom-k sample. Once merged, these fix the global imputation values,
+ranges and category sets (``plan_pass``). The second pass (``shard_pass``)
+imputes each shard with those global values and collects co-moments,
+histograms and contingency counts. Every partial is a plain dict of numbers
+and numpy arrays, and merging is associative, so partials can be combined in
+any order on any host.
+"""
+import numpy as np
+import pandas as pd
+
+from ..features.importance import top_features, select_top_k, mutual_information_from_counts
+from ..features.relationships import count_table_to_series
+from ..statistics.distributions import rank_distributions
+
+# Fine histogram resolution; a multiple of the 50 bins fit_distributions uses
+FINE_BINS = 200
+FIT_BINS = 50
+MI_BINS = 10
+
+_NUMERIC_DTYPES = ['int64', 'float64', 'int32', 'float32']
+
+
+# ---------------------------------------------------------------------------
+# Pass 1: raw column statistics
+# ---------------------------------------------------------------------------
+
+def _numeric_stats(x, nulls, sample_size, rng):
+    n = x.size
+    entry = {'kind': 'numeric', 'nulls': nulls, 'count': n, 'mean': 0.0, 'm2': 0.0,
+             'm3': 0.0, 'm4': 0.0, 'min': np.inf, 'max': -np.inf,
+             'nonpositive': 0, 'log_sum': 0.0, 'log_sumsq': 0.0}
+    if n:
+        mean = x.mean()
+        d = x - mean
+        d2 = d * d
+        positive = x[x > 0]
+        logs = np.log(positive)
+        entry.update(mean=mean, m2=d2.sum(), m3=(d2 * d).sum(), m4=(d2 * d2).sum(),
+                     min=x.min(), max=x.max(), nonpositive=n - positive.size,
+                     log_sum=logs.sum(), log_sumsq=np.dot(logs, logs))
+
+    # Bottom-k sample: keep the values with the smallest random keys, which
+    # stays a uniform sample when shards are merged
+    keys = rng.random(n)
+    if n > sample_size:
+        keep = np.argpartition(keys, sample_size - 1)[:sample_size]
+        entry['sample'], entry['sample_keys'] = x[keep], keys[keep]
+    else:
+        entry['sample'], entry['sample_keys'] = x, keys
+    return entry
+
+
+def shard_stats(df, sample_size=2000, seed=0):
+    """
+    First-pass partial profile of one raw shard.
+
+    Args:
+        df: Shard dataframe
+        sample_size: Size of the per-column sample kept for MLE fitting
+        seed: Random seed for the sample keys (use a distinct seed per shard)
+
+    Returns:
+        dict: Partial profile, mergeable with ``merge_stats``
+    """
+    rng = np.random.default_rng(seed)
+    stats = {'rows': len(df), 'columns': list(df.columns), 'sample_size': sample_size, 'cols': {}}
+    for col in df.columns:
+        series = df[col]
+        nulls = int(series.isnull().sum())
+        if series.dtype in _NUMERIC_DTYPES:
+            x = series.to_numpy(dtype=float, na_value=np.nan)
+            entry = _numeric_stats(x[~np.isnan(x)], nulls, sample_size, rng)
+        else:
+            counts = series.value_counts()
+            entry = {'kind': 'categorical', 'nulls': nulls,
+                     'counts': dict(zip(counts.index.tolist(), counts.to_numpy().tolist()))}
+        entry['dtype'] = str(series.dtype)
+        stats['cols'][col] = entry
+    return stats
+
+
+def _merge_moments(a, b):
+    na, nb = a['count'], b['count']
+    if na == 0:
+        return dict(b, nulls=a['nulls'] + b['nulls'])
+    if nb == 0:
+        return dict(a, nulls=a['nulls'] + b['nulls'])
+
+    n = na + nb
+    delta = b['mean'] - a['mean']
+    m2 = a['m2'] + b['m2'] + delta ** 2 * na * nb / n
+    m3 = (a['m3'] + b['m3'] + delta ** 3 * na * nb * (na - nb) / n ** 2
+          + 3 * delta * (na * b['m2'] - nb * a['m2']) / n)
+    m4 = (a['m4'] + b['m4'] + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+          + 6 * delta ** 2 * (na * na * b['m2'] + nb * nb * a['m2']) / n ** 2
+          + 4 * delta * (na * b['m3'] - nb * a['m3']) / n)
+
+    sample = np.concatenate([a['sample'], b['sample']])
+    keys = np.concatenate([a['sample_keys'], b['sample_keys']])
+    size = max(len(a['sample']), len(b['sample']))
+    if len(keys) > size:
+        keep = np.argpartition(keys, size - 1)[:size]
+        sample, keys = sample[keep], keys[keep]
+
+    return {
+        'kind': 'numeric', 'dtype': a['dtype'], 'nulls': a['nulls'] + b['nulls'], 'count': n,
+        'mean': a['mean'] + delta * nb / n, 'm2': m2, 'm3': m3, 'm4': m4,
+        'min': min(a['min'], b['min']), 'max': max(a['max'], b['max']),
+        'nonpositive': a['nonpositive'] + b['nonpositive'],
+        'log_sum': a['log_sum'] + b['log_sum'], 'log_sumsq': a['log_sumsq'] + b['log_sumsq'],
+        'sample': sample, 'sample_keys': keys,
+    }
+
+
+def _merge_column(col, a, b):
+    if a['kind'] != b['kind']:
+        # A shard where the column is entirely null reads back as float64;
+        # it carries no information about the column's real type
+        for empty, other in ((a, b), (b, a)):
+            if empty['kind'] == 'numeric' and empty['count'] == 0:
+                return dict(other, nulls=other['nulls'] + empty['nulls'])
+        raise ValueError(f"Column '{col}' has inconsistent dtypes across shards: "
+                         f"{a['dtype']} and {b['dtype']}")
+
+    if a['kind'] == 'numeric':
+        return _merge_moments(a, b)
+
+    counts = dict(a['counts'])
+    for value, count in b['counts'].items():
+        counts[value] = counts.get(value, 0) + count
+    return {'kind': 'categorical', 'dtype': a['dtype'], 'nulls': a['nulls'] + b['nulls'],
+            'counts': counts}
+
+
+def merge_stats(a, b):
+    """Merge two first-pass partial profiles."""
+    if a['columns'] != b['columns']:
+        raise ValueError("Shards have different columns")
+    return {
+        'rows': a['rows'] + b['rows'],
+        'columns': a['columns'],
+        'sample_size': a['sample_size'],
+        'cols': {col: _merge_column(col, a['cols'][col], b['cols'][col]) for col in a['columns']},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Coordinator planning between passes
+# ---------------------------------------------------------------------------
+
+def _sorted_values(values):
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=str)
+
+
+def plan_pass(stats, target):
+    """
+    Derive the global values every worker needs for the second pass.
+
+    Mirrors ``fill_missing``: numeric columns are filled with their mean and
+    other columns with their mode.
+
+    Args:
+        stats: Merged first-pass profile
+        target: Target column name
+
+    Returns:
+        dict: Second-pass context (schema, fill values, ranges, categories)
+    """
+    if target not in stats['columns']:
+        raise KeyError(f"Target column '{target}' not in shards")
+
+    context = {'target': target, 'numeric': [], 'categorical': [], 'fill': {},
+               'mean': {}, 'std': {}, 'range': {}, 'categories': {}}
+    for col in stats['columns']:
+        entry = stats['cols'][col]
+        if entry['kind'] == 'numeric':
+            context['numeric'].append(col)
+            fill = entry['mean'] if entry['nulls'] and entry['count'] else None
+            n = entry['count'] + (entry['nulls'] if fill is not None else 0)
+            context['fill'][col] = fill
+            context['mean'][col] = entry['mean'] if entry['count'] else np.nan
+            context['std'][col] = np.sqrt(entry['m2'] / (n - 1)) if n > 1 else np.nan
+            context['range'][col] = (entry['min'], entry['max'])
+        else:
+            context['categorical'].append(col)
+            counts = entry['counts']
+            fill = None
+            if entry['nulls'] and counts:
+                top = max(counts.values())
+                fill = _sorted_values(v for v, c in counts.items() if c == top)[0]
+            context['fill'][col] = fill
+            context['categories'][col] = _sorted_values(counts)
+    return context
+
+
+# ---------------------------------------------------------------------------
+# Pass 2: statistics of the imputed shard
+# ---------------------------------------------------------------------------
+
+def _fine_codes(x, lo, hi):
+    """Equal-width bin codes on [lo, hi] (np.histogram convention); NaN -> -1."""
+    codes = np.full(x.shape, -1, dtype=np.intp)
+    valid = ~np.isnan(x)
+    if hi > lo:
+        scaled = np.floor((x[valid] - lo) / (hi - lo) * FINE_BINS)
+        codes[valid] = np.clip(scaled, 0, FINE_BINS - 1).astype(np.intp)
+    else:
+        codes[valid] = 0
+    return codes
+
+
+def _sparse_counts(keys):
+    keys, counts = np.unique(keys, return_counts=True)
+    return {'keys': keys, 'counts': counts}
+
+
+def shard_pass(df, context):
+    """
+    Second-pass partial profile of one shard, imputed with the global values.
+
+    Args:
+        df: Shard dataframe (raw, as loaded)
+        context: Output of ``plan_pass``
+
+    Returns:
+        dict: Partial profile, mergeable with ``merge_pass``
+    """
+    target = context['target']
+    numeric = context['numeric']
+    p = len(numeric)
+
+    raw = np.empty((len(df), p))
+    for j, col in enumerate(numeric):
+        raw[:, j] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+    # Histograms of the raw values, used for distribution fits
+    raw_hist = np.zeros((p, FINE_BINS), dtype=np.int64)
+    filled = raw.copy()
+    codes = {}
+    for j, col in enumerate(numeric):
+        lo, hi = context['range'][col]
+        if np.isfinite(lo):
+            raw_codes = _fine_codes(raw[:, j], lo, hi)
+            raw_hist[j] = np.bincount(raw_codes[raw_codes >= 0], minlength=FINE_BINS)
+        if context['fill'][col] is not None:
+            filled[np.isnan(filled[:, j]), j] = context['fill'][col]
+        codes[col] = (_fine_codes(filled[:, j], lo, hi) if np.isfinite(lo)
+                      else np.full(len(df), -1, dtype=np.intp), FINE_BINS)
+
+    for col in context['categorical']:
+        series = df[col]
+        if context['fill'][col] is not None:
+            series = series.fillna(context['fill'][col])
+        cat_codes = pd.Categorical(series, categories=context['categories'][col]).codes
+        codes[col] = (cat_codes.astype(np.intp), len(context['categories'][col]))
+
+    mean = np.array([context['mean'][col] for col in numeric])
+    std = np.array([context['std'][col] for col in numeric])
+    centered = np.nan_to_num(filled - mean)
+    with np.errstate(invalid='ignore'):
+        outliers = (np.abs(centered) > 3 * std).sum(axis=0)
+
+    partial = {
+        'rows': len(df),
+        'comoment': centered.T @ centered,
+        'outliers': outliers,
+        'raw_hist': raw_hist,
+        'mutual_information': {},
+        'categorical': {},
+    }
+
+    # Joint counts of every feature with the target, at fine resolution
+    y_codes, ky = codes[target]
+    for col, (x_codes, _) in codes.items():
+        if col == target:
+            continue
+        both = (x_codes >= 0) & (y_codes >= 0)
+        partial['mutual_information'][col] = _sparse_counts(x_codes[both] * ky + y_codes[both])
+
+    # Categorical columns against the target
+    numeric_target = target in context['numeric']
+    if numeric_target:
+        y = filled[:, numeric.index(target)]
+    for col in context['categorical']:
+        if col == target:
+            continue
+        x_codes, kx = codes[col]
+        if numeric_target:
+            valid = (x_codes >= 0) & ~np.isnan(y)
+            partial['categorical'][col] = {
+                'sums': np.bincount(x_codes[valid], weights=y[valid], minlength=kx),
+                'counts': np.bincount(x_codes[valid], minlength=kx),
+            }
+        else:
+            both = (x_codes >= 0) & (y_codes >= 0)
+            partial['categorical'][col] = {
+                'joint': np.bincount(x_codes[both] * ky + y_codes[both], minlength=kx * ky),
+            }
+    return partial
+
+
+def _merge_sparse(a, b):
+    keys = np.concatenate([a['keys'], b['keys']])
+    counts = np.concatenate([a['counts'], b['counts']])
+    keys, inverse = np.unique(keys, return_inverse=True)
+    return {'keys': keys, 'counts': np.bincount(inverse, weights=counts).astype(np.int64)}
+
+
+def merge_pass(a, b):
+    """Merge two second-pass partial profiles."""
+    return {
+        'rows': a['rows'] + b['rows'],
+        'comoment': a['comoment'] + b['comoment'],
+        'outliers': a['outliers'] + b['outliers'],
+        'raw_hist': a['raw_hist'] + b['raw_hist'],
+        'mutual_information': {col: _merge_sparse(a['mutual_information'][col], b['mutual_information'][col])
+                               for col in a['mutual_information']},
+        'categorical': {col: {key: a['categorical'][col][key] + b['categorical'][col][key]
+                              for key in a['categorical'][col]}
+                        for col in a['categorical']},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Final insights
+# ---------------------------------------------------------------------------
+
+def _hist_quantiles(hist, lo, hi, probs):
+    """Interpolated quantiles of a fine histogram on [lo, hi]."""
+    cum = np.concatenate(([0], np.cumsum(hist)))
+    edges = np.linspace(lo, hi, len(hist) + 1)
+    return np.interp(np.asarray(probs) * cum[-1], cum, edges)
+
+
+def _quantile_groups(marginal, n_bins=MI_BINS):
+    """Map fine bins to approximately equal-frequency groups."""
+    total = marginal.sum()
+    if total == 0:
+        return np.zeros(len(marginal), dtype=np.intp)
+    before = (np.cumsum(marginal) - marginal) / total
+    levels = np.linspace(0, 1, n_bins + 1)[1:-1]
+    return np.searchsorted(levels, before, side='right')
+
+
+def _coarsen(joint, groups, axis):
+    moved = np.moveaxis(joint, axis, 0)
+    out = np.zeros((groups.max() + 1,) + moved.shape[1:])
+    np.add.at(out, groups, moved)
+    return np.moveaxis(out, 0, axis)
+
+
+def _fit_summary(entry, hist):
+    """Rebuild the ``column_summary`` dict of fit_distributions from partials."""
+    n = entry['count']
+    lo, hi = entry['min'], entry['max']
+    if n < 2 or lo == hi:
+        return None
+    m2 = entry['m2'] / n
+    summary = {
+        'n': n,
+        'mean': entry['mean'],
+        'var': entry['m2'] / (n - 1),
+        'skew': entry['m3'] / n / m2 ** 1.5,
+        'kurt': entry['m4'] / n / m2 ** 2 - 3,
+        'min': lo,
+        'max': hi,
+        'quantiles': _hist_quantiles(hist, lo, hi, [0.25, 0.5, 0.75]),
+        'edges': np.linspace(lo, hi, FIT_BINS + 1),
+        'counts': hist.reshape(FIT_BINS, -1).sum(axis=1),
+        'log_mean': None,
+        'log_std': None,
+        'sample': entry['sample'],
+    }
+    if entry['nonpositive'] == 0:
+        log_mean = entry['log_sum'] / n
+        summary['log_mean'] = log_mean
+        summary['log_std'] = np.sqrt(max(entry['log_sumsq'] - n * log_mean ** 2, 0.0) / (n - 1))
+    return summary
+
+
+def _numeric_target_distribution(entry, context, hist, target):
+    # Imputed values sit at the mean: higher central moments are unchanged
+    fill = context['fill'][target]
+    n = entry['count'] + (entry['nulls'] if fill is not None else 0)
+    lo, hi = entry['min'], entry['max']
+    if fill is not None:
+        hist = hist.copy()
+        hist[_fine_codes(np.array([fill]), lo, hi)[0]] += entry['nulls']
+    m2, m3, m4 = entry['m2'], entry['m3'], entry['m4']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skew = np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5
+        kurt = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+    return {
+        'mean': entry['mean'],
+        'std_dev': np.sqrt(m2 / (n - 1)),
+        'skewness': skew,
+        'kurtosis': kurt,
+        'median': _hist_quantiles(hist, lo, hi, [0.5])[0],
+        'min': lo,
+        'max': hi,
+    }
+
+
+def _categorical_target_distribution(entry, context, target):
+    counts = dict(entry['counts'])
+    fill = context['fill'][target]
+    if fill is not None:
+        counts[fill] += entry['nulls']
+    value_counts = dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+    return {
+        'dtype': entry['dtype'],
+        'unique_count': len(counts),
+        'unique_values': list(context['categories'][target]),
+        'value_counts': value_counts,
+    }
+
+
+def build_insights(stats, context, passdata):
+    """
+    Assemble the ``full_eda`` insights dict from merged partial profiles.
+
+    Correlations, outlier counts, missing percentages and categorical
+    relationships are exact. The target median and the mutual information
+    of numeric columns are computed from fine histograms and are therefore
+    approximate.
+
+    Args:
+        stats: Merged first-pass profile
+        context: Output of ``plan_pass``
+        passdata: Merged second-pass profile
+
+    Returns:
+        dict: Insights with the same keys as ``full_eda``
+    """
+    target = context['target']
+    numeric = context['numeric']
+    cols = stats['cols']
+    insights = {}
+
+    insights["missing"] = pd.Series(
+        {col: cols[col]['nulls'] / stats['rows'] * 100 for col in stats['columns']}, dtype=float)
+
+    fits = {}
+    for j, col in enumerate(numeric):
+        fits[col] = rank_distributions(_fit_summary(cols[col], passdata['raw_hist'][j]))
+    insights["distribution_fits"] = fits
+
+    if target in numeric:
+        hist = passdata['raw_hist'][numeric.index(target)]
+        insights["target_distribution"] = _numeric_target_distribution(cols[target], context, hist, target)
+    else:
+        insights["target_distribution"] = _categorical_target_distribution(cols[target], context, target)
+
+    insights["outliers"] = {col: int(count) for col, count in zip(numeric, passdata['outliers'])
+                            if count > 0}
+
+    # Mutual information from fine joint counts, coarsened to quantile bins
+    ky = FINE_BINS if target in numeric else len(context['categories'][target])
+    scores = {}
+    for col in stats['columns']:
+        if col == target:
+            continue
+        kx = FINE_BINS if col in numeric else len(context['categories'][col])
+        sparse = passdata['mutual_information'][col]
+        joint = np.bincount(sparse['keys'], weights=sparse['counts'], minlength=kx * ky).reshape(kx, ky)
+        if col in numeric:
+            joint = _coarsen(joint, _quantile_groups(joint.sum(axis=1)), axis=0)
+        if target in numeric:
+            joint = _coarsen(joint, _quantile_groups(joint.sum(axis=0)), axis=1)
+        scores[col] = mutual_information_from_counts(joint)
+    scores = pd.Series(scores, dtype=float)
+    mutual_info = select_top_k(scores, len(scores))
+
+    if target in numeric:
+        comoment = passdata['comoment']
+        scale = np.sqrt(np.diag(comoment))
+        t = numeric.index(target)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.clip(comoment[:, t] / (scale * scale[t]), -1.0, 1.0)
+        num_corr = pd.Series(corr, index=numeric, name=target).sort_values(ascending=False)
+        insights["correlation"] = num_corr
+        insights["top_features"] = top_features(num_corr)
+    else:
+        insights["correlation"] = pd.Series(dtype=float)
+        insights["top_features"] = top_features(mutual_info)
+    insights["mutual_information"] = mutual_info
+
+    relationships = {}
+    for col, tables in passdata['categorical'].items():
+        labels = context['categories'][col]
+        if 'sums' in tables:
+            present = tables['counts'] > 0
+            means = tables['sums'][present] / tables['counts'][present]
+            relationships[col] = pd.Series(
+                means, index=pd.Index(np.asarray(labels, dtype=object)[present], name=col), name=target)
+        else:
+            y_labels = context['categories'][target]
+            counts = tables['joint'].reshape(len(labels), len(y_labels))
+            relationships[col] = count_table_to_series(counts, labels, y_labels, col, target)
+    insights["categorical_relationships"] = relationships
+
+    return insights
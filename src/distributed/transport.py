@@ -0,0 +1,190 @@
+"""
+Pluggable transports between the profiling coordinator and its workers.
+
+A transport moves opaque byte payloads. The coordinator side calls
+``open(n_workers)``, hands ``endpoint(worker_id)`` to each worker, waits with
+``wait_for_workers()`` and then exchanges messages with ``send``/``recv``.
+``open`` is idempotent, so endpoints can be handed out before profiling.
+The worker side calls ``endpoint.connect()`` to get a channel with
+``send``/``recv``/``close``. ``wait_for_workers`` and ``recv`` raise
+``TimeoutError`` when their timeout expires. Endpoints are picklable so they can be passed
+to worker processes, or recreated on another host for ``SocketTransport``.
+"""
+import multiprocessing
+import os
+import pickle
+import queue
+import select
+import time
+import zlib
+from multiprocessing.connection import Client, Listener, wait
+
+
+def dumps(obj):
+    """Serialize a message or partial profile to compact bytes."""
+    return zlib.compress(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def loads(data):
+    """Inverse of ``dumps``."""
+    return pickle.loads(zlib.decompress(data))
+
+
+# ---------------------------------------------------------------------------
+# Multiprocessing queues (single host)
+# ---------------------------------------------------------------------------
+
+class _QueueChannel:
+    def __init__(self, worker_id, tasks, results):
+        self.worker_id = worker_id
+        self._tasks = tasks
+        self._results = results
+
+    def send(self, data):
+        self._results.put((self.worker_id, data))
+
+    def recv(self):
+        return self._tasks.get()
+
+    def close(self):
+        pass
+
+
+class QueueEndpoint:
+    def __init__(self, worker_id, tasks, results):
+        self.worker_id = worker_id
+        self._tasks = tasks
+        self._results = results
+
+    def connect(self):
+        return _QueueChannel(self.worker_id, self._tasks, self._results)
+
+
+class QueueTransport:
+    """Transport over ``multiprocessing`` queues; workers must run on this host."""
+
+    def __init__(self, context=None):
+        self._context = context or multiprocessing.get_context()
+        self._tasks = []
+        self._results = None
+
+    def open(self, n_workers):
+        if self._tasks:
+            return
+        self._tasks = [self._context.Queue() for _ in range(n_workers)]
+        self._results = self._context.Queue()
+
+    def endpoint(self, worker_id):
+        return QueueEndpoint(worker_id, self._tasks[worker_id], self._results)
+
+    def wait_for_workers(self, timeout=None):
+        pass
+
+    def send(self, worker_id, data):
+        self._tasks[worker_id].put(data)
+
+    def recv(self, timeout=None):
+        try:
+            return self._results.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No worker responded in time") from None
+
+    def close(self):
+        for queue in self._tasks + [self._results]:
+            if queue is not None:
+                queue.close()
+
+
+# ---------------------------------------------------------------------------
+# Sockets (one or many hosts)
+# ---------------------------------------------------------------------------
+
+class _SocketChannel:
+    def __init__(self, connection):
+        self._connection = connection
+
+    def send(self, data):
+        self._connection.send_bytes(data)
+
+    def recv(self):
+        return self._connection.recv_bytes()
+
+    def close(self):
+        self._connection.close()
+
+
+class SocketEndpoint:
+    def __init__(self, worker_id, address, authkey):
+        self.worker_id = worker_id
+        self.address = address
+        self.authkey = authkey
+
+    def connect(self):
+        connection = Client(self.address, authkey=self.authkey)
+        connection.send(self.worker_id)
+        return _SocketChannel(connection)
+
+
+class SocketTransport:
+    """
+    Transport over authenticated TCP sockets.
+
+    Workers connect to ``address``; by default the coordinator listens on an
+    ephemeral localhost port. To run workers on other hosts, bind to a
+    reachable interface and start ``run_worker(SocketEndpoint(...))`` there
+    with the same ``authkey``.
+    """
+
+    def __init__(self, address=("127.0.0.1", 0), authkey=None):
+        self._address = address
+        self.authkey = authkey or os.urandom(32)
+        self._listener = None
+        self._connections = {}
+
+    @property
+    def address(self):
+        return self._listener.address
+
+    def open(self, n_workers):
+        if self._listener is not None:
+            return
+        self._n_workers = n_workers
+        self._listener = Listener(self._address, authkey=self.authkey)
+
+    def endpoint(self, worker_id):
+        return SocketEndpoint(worker_id, self.address, self.authkey)
+
+    def wait_for_workers(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Listener.accept() has no timeout; poll the listening socket instead
+        listening_socket = self._listener._listener._socket
+        while len(self._connections) < self._n_workers:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            ready, _, _ = select.select([listening_socket], [], [], remaining)
+            if not ready:
+                raise TimeoutError(f"Only {len(self._connections)} of {self._n_workers} "
+                                   f"workers connected in time")
+            connection = self._listener.accept()
+            self._connections[connection.recv()] = connection
+
+    def send(self, worker_id, data):
+        self._connections[worker_id].send_bytes(data)
+
+    def recv(self, timeout=None):
+        ready = wait(list(self._connections.values()), timeout)
+        if not ready:
+            raise TimeoutError("No worker responded in time")
+        connection = ready[0]
+        worker_id = next(w for w, c in self._connections.items() if c is connection)
+        try:
+            return worker_id, connection.recv_bytes()
+        except EOFError:
+            raise ConnectionError(f"Worker {worker_id} disconnected") from None
+
+    def close(self):
+        for connection in self._connections.values():
+            connection.close()
+        self._connections = {}
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
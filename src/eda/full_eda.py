@@ -1,68 +1,302 @@
+import os
+import warnings
+import numpy as np
 import pandas as pd
-from ..cleaning.missing_values import missing_percentage, fill_missing
+from ..cleaning.missing_values import missing_percentage, fill_missing, NullBitsets
 from ..cleaning.outliers import detect_outliers_zscore
-from ..features.relationships import numerical_relationship, categorical_relationship
-from ..features.importance import top_features
-from ..statistics.distributions import analyze_distribution
+from ..features.relationships import (numerical_relationship, categorical_relationship,
+                                      numerical_relationships, categorical_relationships)
+from ..features.importance import top_features, mutual_information, encode_frame
+from ..statistics.distributions import analyze_distribution, fit_distributions
+from ..reporting.report import ReportWriter
 from ..visualization import generate_visualizations
+from ..distributed.profiles import shard_stats, merge_stats, plan_pass, shard_pass, merge_pass, build_insights
+from .planner import plan_eda
 
 
-def full_eda(df, target, generate_viz=False, viz_save_path="visualizations"):
+def _is_numeric_target(series):
+    # Same test as categorical_relationship(s): other numeric dtypes are
+    # treated as categorical targets throughout
+    return series.dtype in ['int64', 'float64']
+
+
+def _target_distribution(series):
+    # Distribution analysis only for numeric columns
+    if _is_numeric_target(series):
+        return analyze_distribution(series)
+    # For categorical targets, provide basic info about the target
+    return {
+        'dtype': str(series.dtype),
+        'unique_count': series.nunique(),
+        'unique_values': series.unique().tolist(),
+        'value_counts': series.value_counts().to_dict()
+    }
+
+
+def _outlier_counts(df):
+    # Outliers (only for numeric columns)
+    outlier_cols = {}
+    for col in df.select_dtypes(include=["int64", "float64"]):
+        outliers = detect_outliers_zscore(df[col])
+        if len(outliers) > 0:
+            outlier_cols[col] = len(outliers)
+    return outlier_cols
+
+
+def _sample_rows(sample, sample_keys, chunk, rng, k):
+    """Bottom-k row sample: stays uniform over all chunks seen so far."""
+    keys = rng.random(len(chunk))
+    if len(chunk) > k:
+        keep = np.argpartition(keys, k - 1)[:k]
+        chunk, keys = chunk.iloc[keep], keys[keep]
+    if sample is not None:
+        chunk, keys = pd.concat([sample, chunk]), np.concatenate([sample_keys, keys])
+        if len(chunk) > k:
+            keep = np.argpartition(keys, k - 1)[:k]
+            chunk, keys = chunk.iloc[keep], keys[keep]
+    return chunk, keys
+
+
+def _chunked_profile(path, target, plan):
+    """
+    Profile a CSV file chunk by chunk, in the two passes of ``distributed.profiles``.
+
+    Returns:
+        tuple: (insights, row count, column names, imputed row sample or None)
+    """
+    stats = None
+    for i, chunk in enumerate(pd.read_csv(path, chunksize=plan.chunk_rows)):
+        plan.check("chunk")
+        partial = shard_stats(chunk, seed=i)
+        stats = partial if stats is None else merge_stats(stats, partial)
+    context = plan_pass(stats, target)
+
+    passdata = sample = sample_keys = None
+    rng = np.random.default_rng(0)
+    for chunk in pd.read_csv(path, chunksize=plan.chunk_rows):
+        plan.check("chunk")
+        partial = shard_pass(chunk, context)
+        passdata = partial if passdata is None else merge_pass(passdata, partial)
+        if plan.sample_rows:
+            sample, sample_keys = _sample_rows(sample, sample_keys, chunk, rng, plan.sample_rows)
+
+    if sample is not None:
+        sample = sample.sort_index().fillna(
+            {col: fill for col, fill in context['fill'].items() if fill is not None})
+    return build_insights(stats, context, passdata), stats['rows'], stats['columns'], sample
+
+
+def full_eda(df, target, generate_viz=False, viz_save_path="visualizations", n_jobs=None,
+             report_path=None, corr_method="pearson", memory_budget=None, distribution_fits=True):
     """
     Perform full EDA on a dataset.
 
     Args:
-        df: Input dataframe
+        df: Input dataframe, or path to a CSV file
         target: Target column name
         generate_viz: Whether to generate visualizations (default False)
         viz_save_path: Path to save visualizations (default "visualizations")
+        n_jobs: Worker processes for distribution fitting (default: auto)
+        report_path: Stream each insight stage to this report file as it
+            completes (see ``reporting.report``; default None)
+        corr_method: Correlation used for numeric targets: "pearson",
+            "spearman", "kendall" or "kendall_approx" (default "pearson")
+        memory_budget: Memory budget for the process, e.g. "8GB" (default
+            None: no planning). Each stage's footprint is estimated up front
+            and strategies that fit are chosen and logged (see
+            ``eda.planner``); ``MemoryBudgetExceeded`` is raised before a
+            stage that would exceed the budget. Under a budget the given
+            dataframe may be imputed in place, and a CSV path too large to
+            load is profiled in chunks, in which case no cleaned dataframe
+            is materialized and None is returned in its place (chunked
+            profiling computes Pearson correlations only and warns if
+            another ``corr_method`` was requested).
+        distribution_fits: Fit candidate distributions to every numeric
+            column (default True); the stage is omitted when False
 
     Returns:
         tuple: (cleaned_dataframe, insights_dict)
     """
-    insights = {}
+    plan = None
+    if memory_budget is not None:
+        plan = plan_eda(df, target, memory_budget, generate_viz=generate_viz, n_jobs=n_jobs,
+                        corr_method=corr_method)
+        plan.log()
+        n_jobs = plan.n_jobs
 
-    # Missing values
-    insights["missing"] = missing_percentage(df)
+    def checkpoint(stage):
+        if plan is not None:
+            plan.check(stage)
 
-    # Handle missing
-    df = fill_missing(df)
+    def strategy(stage):
+        return plan.strategies.get(stage) if plan is not None else None
 
-    # Target variable distribution analysis (only for numeric columns)
-    if df[target].dtype in ['int64', 'float64']:
-        insights["target_distribution"] = analyze_distribution(df[target])
+    insights = {}
+    viz_df = None
+    if strategy("load") == "chunked":
+        if corr_method != "pearson":
+            warnings.warn(f"corr_method='{corr_method}' is not supported when profiling in chunks; "
+                          "Pearson correlations are computed instead", stacklevel=2)
+        insights, n_rows, columns, viz_df = _chunked_profile(df, target, plan)
+        if not distribution_fits:
+            del insights["distribution_fits"]
+        df = None
     else:
-        # For categorical targets, provide basic info about the target
-        insights["target_distribution"] = {
-            'dtype': str(df[target].dtype),
-            'unique_count': df[target].nunique(),
-            'unique_values': df[target].unique().tolist(),
-            'value_counts': df[target].value_counts().to_dict()
-        }
+        if not isinstance(df, pd.DataFrame):
+            checkpoint("load")
+            df = pd.read_csv(df)
+        n_rows, columns = len(df), list(df.columns)
 
-    # Outliers (only for numeric columns)
-    outlier_cols = {}
-    for col in df.select_dtypes(include=["int64", "float64"]):
-        outliers = detect_outliers_zscore(df[col])
-        if len(outliers) > 0:
-            outlier_cols[col] = len(outliers)
-    insights["outliers"] = outlier_cols
+    writer = None
+    if report_path:
+        writer = ReportWriter(report_path, meta={"target": target, "rows": n_rows, "columns": columns})
 
-    # Numerical relationships (only if target is numeric)
-    if df[target].dtype in ['int64', 'float64']:
-        num_corr = numerical_relationship(df, target)
-        insights["correlation"] = num_corr
-        insights["top_features"] = top_features(num_corr)
-    else:
-        # For categorical targets, we can't compute correlation, so return empty
-        insights["correlation"] = pd.Series(dtype=float)
-        insights["top_features"] = pd.Series(dtype=float)
+    def record(stage, value):
+        insights[stage] = value
+        if writer is not None:
+            writer.write(stage, value)
+
+    try:
+        if df is None:
+            # Chunked profiling already produced every stage
+            for stage, value in list(insights.items()):
+                record(stage, value)
+        else:
+            # Missing values (null masks packed once, reused when filling)
+            checkpoint("missing")
+            null_bitsets = NullBitsets.from_frame(df)
+            record("missing", missing_percentage(df, null_bitsets))
+
+            # Best-fit distributions for numeric columns (fitted before imputation
+            # so filled values don't distort the shape)
+            if distribution_fits:
+                checkpoint("distribution_fits")
+                record("distribution_fits", fit_distributions(df, n_jobs=n_jobs))
+
+            # Handle missing
+            checkpoint("fill_missing")
+            df = fill_missing(df, bitsets=null_bitsets, inplace=strategy("fill_missing") == "inplace")
+
+            # Row sample for the stages the plan runs as sketches
+            sample = df
+            if plan is not None and plan.sample_rows and plan.sample_rows < len(df):
+                sample = df.sample(n=plan.sample_rows, random_state=0)
+
+            # Target variable distribution analysis
+            checkpoint("target_distribution")
+            record("target_distribution", _target_distribution(df[target]))
+
+            # Outliers
+            checkpoint("outliers")
+            record("outliers", _outlier_counts(df))
 
-    # Categorical relationships
-    insights["categorical_relationships"] = categorical_relationship(df, target)
+            # Nonlinear relationships for numeric and categorical features alike
+            checkpoint("mutual_information")
+            mutual_info = mutual_information(sample if strategy("mutual_information") == "sketch" else df,
+                                             target)
 
-    # Generate visualizations if requested
-    if generate_viz:
-        generate_visualizations(df, target, viz_save_path)
+            # Numerical relationships (only if target is numeric)
+            if _is_numeric_target(df[target]):
+                checkpoint("correlation")
+                num_corr = numerical_relationship(sample if strategy("correlation") == "sketch" else df,
+                                                  target, method=corr_method)
+                record("correlation", num_corr)
+                record("top_features", top_features(num_corr))
+            else:
+                # For categorical targets, we can't compute correlation, so return empty
+                # and rank features by mutual information instead
+                record("correlation", pd.Series(dtype=float))
+                record("top_features", top_features(mutual_info))
+            record("mutual_information", mutual_info)
+
+            # Categorical relationships
+            checkpoint("categorical_relationships")
+            record("categorical_relationships", categorical_relationship(df, target))
+
+            if strategy("visualizations") == "aggregates":
+                viz_df = sample
+
+        # Generate visualizations if requested
+        if generate_viz:
+            checkpoint("visualizations")
+            if viz_df is not None:
+                # Plot from full-data insights plus a row sample
+                plots = generate_visualizations(viz_df, target, viz_save_path, insights=insights)
+            else:
+                plots = generate_visualizations(df, target, viz_save_path)
+            if writer is not None:
+                writer.write("visualizations", plots)
+    finally:
+        if writer is not None:
+            writer.close()
 
     return df, insights
+
+
+def full_eda_multi(df, targets, generate_viz=False, viz_save_path="visualizations", n_jobs=None,
+                   corr_method="pearson", distribution_fits=True):
+    """
+    Perform full EDA on a dataset against several candidate targets.
+
+    Target-independent stages (missing values, distribution fits,
+    imputation, outliers, column encoding) run once. Correlations for all
+    numeric targets come from a single pass, and every categorical column
+    is grouped once for all targets.
+
+    Args:
+        df: Input dataframe
+        targets: List of target column names, e.g. the names returned by
+            ``suggest_target_variables``
+        generate_viz: Whether to generate visualizations (default False)
+        viz_save_path: Path to save visualizations; each target gets its
+            own subdirectory (default "visualizations")
+        n_jobs: Worker processes for distribution fitting (default: auto)
+        corr_method: Correlation used for numeric targets (see ``full_eda``)
+        distribution_fits: Fit candidate distributions (see ``full_eda``)
+
+    Returns:
+        tuple: (cleaned_dataframe, {target: insights_dict})
+    """
+    targets = list(dict.fromkeys(targets))
+    missing = [t for t in targets if t not in df.columns]
+    if missing:
+        raise KeyError(f"Target columns not in dataframe: {missing}")
+
+    # Target-independent stages
+    null_bitsets = NullBitsets.from_frame(df)
+    missing_pct = missing_percentage(df, null_bitsets)
+    fits = fit_distributions(df, n_jobs=n_jobs) if distribution_fits else None
+    df = fill_missing(df, bitsets=null_bitsets)
+    outliers = _outlier_counts(df)
+    codes = encode_frame(df)
+
+    # Target-dependent stages, batched across targets
+    numeric_targets = [t for t in targets if _is_numeric_target(df[t])]
+    correlations = numerical_relationships(df, numeric_targets, method=corr_method)
+    cat_relationships = categorical_relationships(df, targets)
+
+    results = {}
+    for target in targets:
+        insights = {"missing": missing_pct}
+        if fits is not None:
+            insights["distribution_fits"] = fits
+        insights["target_distribution"] = _target_distribution(df[target])
+        insights["outliers"] = outliers
+
+        mutual_info = mutual_information(df, target, codes=codes)
+        if target in correlations.columns:
+            num_corr = correlations[target].sort_values(ascending=False)
+            insights["correlation"] = num_corr
+            insights["top_features"] = top_features(num_corr)
+        else:
+            insights["correlation"] = pd.Series(dtype=float)
+            insights["top_features"] = top_features(mutual_info)
+        insights["mutual_information"] = mutual_info
+        insights["categorical_relationships"] = cat_relationships[target]
+
+        if generate_viz:
+            generate_visualizations(df, target, os.path.join(viz_save_path, str(target)))
+
+        results[target] = insights
+
+    return df, results
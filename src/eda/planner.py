@@ -0,0 +1,440 @@
+"""
+Memory-budget planning for ``full_eda``.
+
+The footprint of every stage is estimated from the schema (bytes per row of
+each column) and the row count, before any stage runs. The planner then
+picks, in order of preference, the cheapest strategy that keeps the whole
+run under the budget:
+
+- imputation copies the frame, or fills it in place;
+- distribution fitting runs in parallel, or serially;
+- correlation, mutual information and plots use every row ("exact" /
+  "raw"), or a uniform row sample ("sketch" / "aggregates", where the
+  plots that can be drawn from full-data aggregates still are);
+- a CSV input is loaded into memory, or profiled in chunks with the
+  mergeable partial profiles of ``distributed.profiles``.
+
+When no strategy fits, ``MemoryBudgetExceeded`` is raised before any work
+is done. While the run progresses, ``MemoryPlan.check`` compares the
+process's resident memory plus the next stage's estimate against the
+budget, so an underestimate fails early instead of swapping.
+"""
+import ctypes
+import ctypes.util
+import io
+import logging
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MIN_SAMPLE_ROWS = 10_000
+MIN_CHUNK_ROWS = 1_000
+MAX_CHUNK_ROWS = 1_000_000
+VIZ_SAMPLE_ROWS = 100_000
+# Share of the budget left unplanned for allocator slack and interpreter growth
+HEADROOM = 0.1
+# Largest figure canvas rendered by generate_visualizations (300 dpi)
+PLOT_BYTES = 128 << 20
+
+# Working copies of the numeric block made by each correlation method
+_CORRELATION_COPIES = {"pearson": 2, "spearman": 4, "kendall": 2, "kendall_approx": 2}
+
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$", re.IGNORECASE)
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """No plan fits the memory budget, or a stage would push the process over it."""
+
+
+def parse_size(size):
+    """
+    Parse a memory size such as ``"8GB"``, ``"512M"`` or ``"1.5GiB"``.
+
+    Units are binary (1 GB = 1024**3 bytes), matching how container memory
+    limits are usually given. Integers are taken as bytes.
+    """
+    if isinstance(size, (int, float, np.integer, np.floating)):
+        return int(size)
+    match = _SIZE_PATTERN.match(str(size))
+    if not match:
+        raise ValueError(f"Cannot parse memory size '{size}'")
+    return int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+
+
+def format_size(n_bytes):
+    """Human-readable size, e.g. ``"1.5 GB"``."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n_bytes) < 1024:
+            return f"{n_bytes:.0f} {unit}" if unit == "B" else f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
+    return f"{n_bytes:.1f} TB"
+
+
+def _load_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+        libc.malloc_trim  # glibc only
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_LIBC = _load_libc()
+
+
+def current_rss():
+    """
+    Resident memory of this process in bytes, or None where unavailable.
+
+    On glibc, freed heap memory is first returned to the OS; otherwise
+    memory released by earlier stages would still count as in use.
+    """
+    if _LIBC is not None:
+        _LIBC.malloc_trim(0)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _is_numeric(dtype):
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def frame_schema(df, sample_rows=MIN_SAMPLE_ROWS, check_nulls=True):
+    """
+    Per-column memory profile of an in-memory dataframe.
+
+    Fixed-width columns use their item size; object columns are measured
+    (``memory_usage(deep=True)``) on the first ``sample_rows`` rows.
+
+    Args:
+        df: Input dataframe
+        sample_rows: Rows measured for object columns
+        check_nulls: Scan columns for nulls; if False every column is
+            assumed to have some
+
+    Returns:
+        pd.DataFrame: Indexed by column name, with columns "dtype", "bytes"
+        (deep bytes per row), "width" (bytes per row of a shallow copy,
+        which shares the objects) and "nulls"
+    """
+    head = df.head(sample_rows)
+    rows = []
+    for col in df.columns:
+        dtype = df[col].dtype
+        width = getattr(dtype, "itemsize", 8)
+        if dtype.kind in "biufcmM":
+            size = width
+        else:
+            size = head[col].memory_usage(deep=True, index=False) / max(len(head), 1)
+        nulls = bool(df[col].hasnans) if check_nulls else True
+        rows.append((dtype, float(size), float(width), nulls))
+    return pd.DataFrame(rows, index=df.columns, columns=["dtype", "bytes", "width", "nulls"])
+
+
+def csv_schema(path, sample_rows=MIN_SAMPLE_ROWS):
+    """
+    Schema and estimated row count of a CSV file, from its first rows.
+
+    Nulls beyond the sampled rows cannot be ruled out, so every column is
+    assumed to have some.
+
+    Returns:
+        tuple: (schema as in ``frame_schema``, estimated row count)
+    """
+    with open(path, "rb") as f:
+        head = b"".join(line for _, line in zip(range(sample_rows + 1), f))
+        complete = not f.read(1)
+    sample = pd.read_csv(io.BytesIO(head))
+    if complete or len(sample) == 0:
+        n_rows = len(sample)
+    else:
+        header_bytes = len(head.split(b"\n", 1)[0]) + 1
+        bytes_per_row = (len(head) - header_bytes) / len(sample)
+        n_rows = int(np.ceil((os.path.getsize(path) - header_bytes) / bytes_per_row))
+    return frame_schema(sample, sample_rows, check_nulls=False), n_rows
+
+
+class MemoryPlan:
+    """
+    Strategies and per-stage footprint estimates for one ``full_eda`` run.
+
+    Attributes:
+        budget: Budget in bytes
+        rows: (Estimated) row count
+        execution: "in_memory" or "chunked"
+        strategies: {stage: strategy}
+        estimates: {stage: estimated working memory in bytes}
+        peak: Estimated peak resident memory of the run
+        sample_rows: Rows sampled by "sketch"/"aggregates" stages (None if unused)
+        chunk_rows: Rows per chunk in chunked mode (None otherwise)
+        n_jobs: Worker processes for distribution fitting
+    """
+
+    def __init__(self, budget, rows, columns, execution, strategies, estimates, peak,
+                 sample_rows=None, chunk_rows=None, n_jobs=None):
+        self.budget = budget
+        self.rows = rows
+        self.columns = columns
+        self.execution = execution
+        self.strategies = strategies
+        self.estimates = estimates
+        self.peak = peak
+        self.sample_rows = sample_rows
+        self.chunk_rows = chunk_rows
+        self.n_jobs = n_jobs
+
+    def describe(self):
+        lines = [f"Memory plan: {self.execution}, {self.rows:,} rows x {self.columns} columns, "
+                 f"estimated peak {format_size(self.peak)} of {format_size(self.budget)} budget"]
+        for stage, strategy in self.strategies.items():
+            estimate = self.estimates.get(stage)
+            suffix = f" (~{format_size(estimate)})" if estimate is not None else ""
+            lines.append(f"  {stage}: {strategy}{suffix}")
+        if self.sample_rows:
+            lines.append(f"  sample rows: {self.sample_rows:,}")
+        if self.chunk_rows:
+            lines.append(f"  chunk rows: {self.chunk_rows:,}")
+        return "\n".join(lines)
+
+    def log(self):
+        for line in self.describe().splitlines():
+            logger.info(line)
+
+    def check(self, stage):
+        """
+        Fail before ``stage`` runs if it would take the process over budget.
+
+        Compares current resident memory plus the stage's estimate with the
+        budget; does nothing where resident memory cannot be measured.
+        """
+        rss = current_rss()
+        if rss is None:
+            return
+        need = self.estimates.get(stage, 0)
+        if rss + need > self.budget:
+            raise MemoryBudgetExceeded(
+                f"Stage '{stage}' needs ~{format_size(need)} with {format_size(rss)} already in use; "
+                f"memory budget is {format_size(self.budget)}")
+
+
+def _stage_costs(schema, target, corr_method, fit_workers):
+    """Working memory per row of every in-memory stage, in bytes."""
+    numeric = [col for col, dtype in schema["dtype"].items() if _is_numeric(dtype)]
+    p, k = len(numeric), len(schema)
+    nullable = schema.loc[schema["nulls"], "width"]
+
+    correlation = 0.0
+    if target in numeric:
+        correlation = p * 8 * _CORRELATION_COPIES[corr_method]
+        if corr_method in ("kendall", "kendall_approx"):
+            correlation += 10 * 8  # per-pair sort buffers
+    return {
+        "missing": k / 8 + 1,
+        # One float column plus summary temporaries per fit; a pool also
+        # keeps two pickled columns per worker in flight in this process
+        "distribution_fits": 5 * 8 if fit_workers == 1 else fit_workers * (5 * 8 + 2 * 2 * 8),
+        # fillna builds a new column next to the old one
+        "fill_missing": 2 * nullable.max() if len(nullable) else 0.0,
+        "target_distribution": 3 * 8,
+        "outliers": 4 * 8,
+        "mutual_information": k * 8 + 3 * 8,
+        "correlation": correlation,
+        "categorical_relationships": 3 * 8,
+        "visualizations": schema["width"].sum() + 2 * p * 8,
+    }
+
+
+def _fit_workers(rows, schema, n_jobs):
+    # Mirrors fit_distributions: serial below one million numeric cells
+    p = sum(_is_numeric(dtype) for dtype in schema["dtype"])
+    if rows * p < 1_000_000:
+        return 1
+    return n_jobs or os.cpu_count() or 1
+
+
+def _plan_in_memory(schema, rows, target, budget, baseline, loaded, generate_viz, n_jobs,
+                    corr_method):
+    frame_bytes = float(schema["bytes"].sum()) * rows
+    copy_bytes = float(schema["width"].sum()) * rows
+    strategies, estimates = {}, {}
+    available = (budget - baseline) * (1 - HEADROOM)
+    # Memory left for stage working sets once the input frame is resident
+    free = available - (0 if loaded else frame_bytes)
+    if not loaded:
+        # The parser holds column buffers alongside the assembled frame
+        strategies["load"], estimates["load"] = "read_csv", frame_bytes
+        load_bytes = 2 * frame_bytes
+        if load_bytes > available:
+            return None, f"loading the data needs ~{format_size(load_bytes)}"
+    if free <= 0:
+        return None, f"{format_size(baseline)} is already in use"
+
+    workers = _fit_workers(rows, schema, n_jobs)
+    if workers > 1 and _stage_costs(schema, target, corr_method, workers)["distribution_fits"] * rows > free:
+        workers = 1
+    costs = _stage_costs(schema, target, corr_method, workers)
+    fixed = {"visualizations": PLOT_BYTES}
+    cost = {stage: per_row * rows + fixed.get(stage, 0) for stage, per_row in costs.items()}
+
+    for stage in ("missing", "distribution_fits"):
+        if cost[stage] > free:
+            return None, f"stage '{stage}' needs ~{format_size(cost[stage])}"
+        estimates[stage] = cost[stage]
+    strategies["missing"] = "exact"
+    strategies["distribution_fits"] = "parallel" if workers > 1 else "serial"
+
+    # Copy on imputation only if every later stage still fits exactly
+    after_fill = ["target_distribution", "outliers", "mutual_information", "correlation",
+                  "categorical_relationships"] + (["visualizations"] if generate_viz else [])
+    largest_later = max(cost[stage] for stage in after_fill)
+    if copy_bytes + max(cost["fill_missing"], largest_later) <= free:
+        strategies["fill_missing"] = "copy"
+        estimates["fill_missing"] = copy_bytes + cost["fill_missing"]
+        free_after = free - copy_bytes
+    elif cost["fill_missing"] <= free:
+        strategies["fill_missing"], estimates["fill_missing"] = "inplace", cost["fill_missing"]
+        free_after = free
+    else:
+        return None, f"stage 'fill_missing' needs ~{format_size(cost['fill_missing'])}"
+
+    # Stages that do not fit run on one shared uniform row sample; the sample
+    # itself takes memory, so repeat until the remaining exact stages fit
+    width = float(schema["width"].sum()) + 8  # plus the sample's index
+    sketched, sample_rows = set(), None
+    while True:
+        sample_rows = None
+        for stage in sketched:
+            n = int(min(rows, (free_after - fixed.get(stage, 0)) // (width + costs[stage])))
+            if n < MIN_SAMPLE_ROWS:
+                return None, f"stage '{stage}' does not fit even on a {MIN_SAMPLE_ROWS:,}-row sample"
+            if stage == "visualizations":
+                n = min(n, VIZ_SAMPLE_ROWS)
+            sample_rows = n if sample_rows is None else min(sample_rows, n)
+        available = free_after - width * (sample_rows or 0)
+        over = [stage for stage in after_fill if stage not in sketched and cost[stage] > available]
+        if not over:
+            break
+        for stage in over:
+            if stage not in ("mutual_information", "correlation", "visualizations"):
+                return None, f"stage '{stage}' needs ~{format_size(cost[stage])}"
+        sketched.update(over)
+
+    for stage in after_fill:
+        if stage in sketched:
+            strategies[stage] = "aggregates" if stage == "visualizations" else "sketch"
+            estimates[stage] = costs[stage] * sample_rows + fixed.get(stage, 0)
+        else:
+            strategies[stage] = "raw" if stage == "visualizations" else "exact"
+            estimates[stage] = cost[stage]
+    resident_after = (copy_bytes if strategies["fill_missing"] == "copy" else 0) + width * (sample_rows or 0)
+
+    resident = baseline + (0 if loaded else frame_bytes)
+    peak = resident + max(max(estimates[stage] for stage in ("missing", "distribution_fits", "fill_missing")),
+                          resident_after + max(estimates[stage] for stage in after_fill))
+    if not loaded:
+        peak = max(peak, baseline + 2 * frame_bytes)
+    if peak > budget:
+        return None, f"the estimated peak is ~{format_size(peak)}"
+    return MemoryPlan(budget, rows, len(schema), "in_memory", strategies, estimates, peak,
+                      sample_rows=sample_rows, n_jobs=workers), None
+
+
+def _plan_chunked(schema, rows, target, budget, baseline, generate_viz, corr_method):
+    numeric = [col for col, dtype in schema["dtype"].items() if _is_numeric(dtype)]
+    p, k = len(numeric), len(schema)
+    row_bytes = float(schema["bytes"].sum())
+    available = free = (budget - baseline) * (1 - HEADROOM)
+
+    viz_rows = 0
+    if generate_viz:
+        # The row sample for plots takes at most a quarter of the budget
+        free -= PLOT_BYTES
+        viz_rows = int(min(rows, VIZ_SAMPLE_ROWS, max(free / 4, 0) // max(2 * row_bytes, 1)))
+        free -= 2 * viz_rows * row_bytes
+
+    # Two parsed chunks (the next one is read while the last is still
+    # referenced), raw/filled/centered numeric blocks and column codes
+    work = 3 * p * 8 + 2 * k * 8
+    per_row = 2 * row_bytes + work
+    chunk_rows = int(min(rows, MAX_CHUNK_ROWS, max(free, 0) // per_row))
+    if chunk_rows < min(MIN_CHUNK_ROWS, rows):
+        reserved = ""
+        if generate_viz:
+            reserved = f", ~{format_size(available - free)} is reserved for plots"
+        hint = ""
+        if generate_viz and available // per_row >= min(MIN_CHUNK_ROWS, rows):
+            hint = "; it would fit without visualizations"
+        raise MemoryBudgetExceeded(
+            f"Memory budget {format_size(budget)} is too small: {format_size(max(baseline, 0))} is already "
+            f"in use{reserved} and a {MIN_CHUNK_ROWS:,}-row chunk needs "
+            f"~{format_size(per_row * MIN_CHUNK_ROWS)}{hint}")
+
+    strategies = {
+        "load": "chunked",
+        "missing": "exact",
+        "distribution_fits": "sketch",
+        "fill_missing": "per-chunk",
+        "outliers": "exact",
+        "mutual_information": "sketch",
+        "correlation": "exact" if corr_method == "pearson" else "exact (pearson)",
+        "categorical_relationships": "exact",
+    }
+    if generate_viz:
+        strategies["visualizations"] = "aggregates"
+    # A chunk is checked once it is parsed, so only its working set is still to come
+    estimates = {"chunk": work * chunk_rows}
+    if generate_viz:
+        estimates["visualizations"] = viz_rows * (row_bytes + 2 * p * 8) + PLOT_BYTES
+    peak = baseline + max(per_row * chunk_rows, estimates.get("visualizations", 0)) + 2 * viz_rows * row_bytes
+    return MemoryPlan(budget, rows, k, "chunked", strategies, estimates, peak,
+                      sample_rows=viz_rows or None, chunk_rows=chunk_rows, n_jobs=1)
+
+
+def plan_eda(data, target, memory_budget, generate_viz=False, n_jobs=None, corr_method="pearson"):
+    """
+    Choose ``full_eda`` strategies that fit a memory budget.
+
+    Args:
+        data: Input dataframe, or path to a CSV file (which may then be
+            profiled in chunks without ever being loaded whole)
+        target: Target column name
+        memory_budget: Budget for the whole process, in bytes or as a
+            string such as "8GB"
+        generate_viz: Whether visualizations will be generated
+        n_jobs: Requested worker processes for distribution fitting
+        corr_method: Correlation method (see ``numerical_relationship``)
+
+    Returns:
+        MemoryPlan
+
+    Raises:
+        MemoryBudgetExceeded: If no strategy fits the budget
+    """
+    budget = parse_size(memory_budget)
+    loaded = isinstance(data, pd.DataFrame)
+    if loaded:
+        schema, rows = frame_schema(data), len(data)
+    else:
+        schema, rows = csv_schema(data)
+    if target not in schema.index:
+        raise KeyError(f"Target column '{target}' not in data")
+    baseline = current_rss() or 0
+
+    plan, reason = _plan_in_memory(schema, rows, target, budget, baseline, loaded, generate_viz,
+                                   n_jobs, corr_method)
+    if plan is not None:
+        return plan
+    if loaded:
+        raise MemoryBudgetExceeded(
+            f"Memory budget {format_size(budget)} is too small for this dataframe "
+            f"({format_size(baseline)} in use): {reason}. Pass a CSV path to profile it in chunks.")
+    logger.info("In-memory profiling does not fit (%s); switching to chunked mode", reason)
+    return _plan_chunked(schema, rows, target, budget, baseline, generate_viz, corr_method)
@@ -1,2 +1,214 @@
-def top_features(correlation_series, n=10):
-    return correlation_series.abs().sort_values(ascending=False).head(n)
+import numpy as np
+import pandas as pd
+
+from .relationships import numerical_relationship
+
+
+def select_top_k(scores, n=10):
+    """
+    Return the n largest entries of a score Series, largest first.
+
+    Uses partial selection (``np.argpartition``) so only the selected
+    entries are sorted. NaN scores are never selected.
+    """
+    values = scores.to_numpy(dtype=float, na_value=np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if n < len(valid):
+        valid = valid[np.argpartition(-values[valid], n - 1)[:n]]
+    order = valid[np.argsort(-values[valid], kind="stable")]
+    return scores.iloc[order]
+
+
+def top_features(correlation_series, n=10, target=None, method="pearson"):
+    """
+    The n features with the strongest relationship, by absolute score.
+
+    Pass a Series of correlations (or other scores), or a dataframe plus
+    ``target`` to correlate with ``method`` first (see
+    ``numerical_relationship``).
+    """
+    if isinstance(correlation_series, pd.DataFrame):
+        correlation_series = numerical_relationship(correlation_series, target, method)
+    return select_top_k(correlation_series.abs(), n)
+
+
+def encode_column(series, n_bins=10):
+    """
+    Encode a column as small integer codes for histogram-based measures.
+
+    Numeric columns are cut at their quantiles, other columns are
+    factorized. Missing values get a code of their own.
+
+    Args:
+        series: Input column
+        n_bins: Maximum number of quantile bins for numeric columns
+
+    Returns:
+        tuple: (codes array, number of distinct codes)
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        missing = np.isnan(values)
+        if missing.all():
+            codes, n_codes = np.zeros(len(values), dtype=np.intp), 1
+        else:
+            interior = np.linspace(0, 1, n_bins + 1)[1:-1]
+            edges = np.unique(np.quantile(values[~missing], interior))
+            codes = np.searchsorted(edges, values, side="right").astype(np.intp)
+            n_codes = len(edges) + 1
+    else:
+        codes, uniques = pd.factorize(series)
+        codes = codes.astype(np.intp)
+        missing = codes < 0
+        n_codes = len(uniques)
+
+    if missing.any():
+        codes[missing] = n_codes
+        n_codes += 1
+    return codes, n_codes
+
+
+def encode_frame(df, n_bins=10):
+    """Encode every column of a dataframe; returns {column: (codes, n_codes)}."""
+    return {col: encode_column(df[col], n_bins) for col in df.columns}
+
+
+def mutual_information_from_counts(joint):
+    """Mutual information (in nats) of a 2-D contingency table of counts."""
+    joint = np.asarray(joint, dtype=float)
+    n = joint.sum()
+    if n == 0:
+        return 0.0
+    px = joint.sum(axis=1)
+    py = joint.sum(axis=0)
+    nz = joint > 0
+    expected = np.outer(px, py)[nz]
+    return float(np.sum(joint[nz] / n * np.log(joint[nz] * n / expected)))
+
+
+def _mutual_information(x_codes, kx, y_codes, ky):
+    joint = np.bincount(x_codes * ky + y_codes, minlength=kx * ky).reshape(kx, ky)
+    return mutual_information_from_counts(joint)
+
+
+def mutual_information(df, target, n_bins=10, codes=None):
+    """
+    Mutual information (in nats) between every feature and the target.
+
+    Works for numeric and categorical features and targets: numeric columns
+    are quantile-binned, and the joint histogram of each feature/target pair
+    is built with a single ``np.bincount``.
+
+    Args:
+        df: Input dataframe
+        target: Target column name
+        n_bins: Quantile bins for numeric columns (default 10)
+        codes: Optional precomputed output of ``encode_frame`` to reuse
+
+    Returns:
+        pd.Series: Mutual information per feature, sorted descending
+    """
+    if codes is None:
+        codes = encode_frame(df, n_bins)
+    y_codes, ky = codes[target]
+
+    scores = {}
+    for col in df.columns:
+        if col == target:
+            continue
+        x_codes, kx = codes[col]
+        scores[col] = _mutual_information(x_codes, kx, y_codes, ky)
+
+    scores = pd.Series(scores, dtype=float)
+    return select_top_k(scores, len(scores))
+
+
+def _fit_additive(codes, y, n_iter=3):
+    """Backfit a piecewise-constant additive model; returns per-row contributions."""
+    mean = y.mean()
+    contributions = np.zeros((len(y), len(codes)), order="F")
+    # Running residual y - mean - sum of contributions, so each feature
+    # update is O(n) rather than O(n * p)
+    residual = y - mean
+    for _ in range(n_iter):
+        for j, (x_codes, kx) in enumerate(codes):
+            partial = residual + contributions[:, j]
+            counts = np.bincount(x_codes, minlength=kx)
+            sums = np.bincount(x_codes, weights=partial, minlength=kx)
+            effect = np.divide(sums, counts, out=np.zeros(kx), where=counts > 0)
+            contributions[:, j] = effect[x_codes]
+            residual = partial - contributions[:, j]
+    return mean, contributions
+
+
+def _fit_naive_bayes(codes, y_codes, ky):
+    """Per-feature log-likelihood tables of a naive Bayes classifier."""
+    prior = np.log((np.bincount(y_codes, minlength=ky) + 1) / (len(y_codes) + ky))
+    contributions = np.empty((len(y_codes), len(codes), ky))
+    for j, (x_codes, kx) in enumerate(codes):
+        joint = np.bincount(x_codes * ky + y_codes, minlength=kx * ky).reshape(kx, ky) + 1
+        contributions[:, j, :] = np.log(joint / joint.sum(axis=0))[x_codes]
+    return prior, contributions
+
+
+def permutation_importance(df, target, n_bins=10, sample_size=5000, n_repeats=3,
+                           random_state=0):
+    """
+    Estimate permutation importance on a row sample.
+
+    A lightweight histogram model is fitted on the sample: an additive model
+    of binned features for numeric targets (scored by R^2) and naive Bayes
+    for categorical targets (scored by accuracy). Because each feature's
+    contribution is stored separately, permuting a feature only swaps its
+    own contribution column instead of refitting or re-predicting.
+
+    Args:
+        df: Input dataframe
+        target: Target column name
+        n_bins: Quantile bins for numeric columns (default 10)
+        sample_size: Maximum number of rows used (default 5000)
+        n_repeats: Number of permutations per feature (default 3)
+        random_state: Seed for sampling and permutations
+
+    Returns:
+        pd.Series: Mean score decrease per feature, sorted descending
+    """
+    rng = np.random.default_rng(random_state)
+    if len(df) > sample_size:
+        df = df.iloc[np.sort(rng.choice(len(df), sample_size, replace=False))]
+
+    features = [col for col in df.columns if col != target]
+    codes = [encode_column(df[col], n_bins) for col in features]
+    target_series = df[target]
+    numeric_target = (pd.api.types.is_numeric_dtype(target_series)
+                      and not pd.api.types.is_bool_dtype(target_series))
+
+    if numeric_target:
+        y = target_series.to_numpy(dtype=float, na_value=np.nan)
+        keep = ~np.isnan(y)
+        y = y[keep]
+        codes = [(x_codes[keep], kx) for x_codes, kx in codes]
+        mean, contributions = _fit_additive(codes, y)
+        total = mean + contributions.sum(axis=1)
+        ss_tot = np.sum((y - y.mean()) ** 2) or 1.0
+
+        def score(prediction):
+            return 1 - np.sum((y - prediction) ** 2) / ss_tot
+    else:
+        y_codes, ky = encode_column(target_series)
+        prior, contributions = _fit_naive_bayes(codes, y_codes, ky)
+        total = prior + contributions.sum(axis=1)
+
+        def score(prediction):
+            return np.mean(prediction.argmax(axis=1) == y_codes)
+
+    baseline = score(total)
+    importances = {}
+    for j, col in enumerate(features):
+        own = contributions[:, j]
+        drops = [baseline - score(total - own + own[rng.permutation(len(own))])
+                 for _ in range(n_repeats)]
+        importances[col] = float(np.mean(drops))
+
+    importances = pd.Series(importances, dtype=float)
+    return select_top_k(importances, len(importances))
@@ -1,12 +1,31 @@
+import numpy as np
 import pandas as pd
 
+from ..statistics.rank_correlation import kendall_tau, spearman_ranks, RankCorrelationSketch
 
-def numerical_relationship(df, target):
+CORRELATION_METHODS = ("pearson", "spearman", "kendall", "kendall_approx")
+
+
+def _check_method(method):
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Unknown correlation method '{method}'; "
+                         f"expected one of {CORRELATION_METHODS}")
+
+
+def numerical_relationship(df, target, method="pearson"):
+    """
+    Correlation of every numeric column with a numeric target.
+
+    ``method`` is one of "pearson", "spearman", "kendall" (exact tau-b in
+    O(n log n)) or "kendall_approx" (binned sketch); rank measures are
+    robust to skewed targets.
+    """
+    _check_method(method)
     # Select only numeric columns for correlation calculation
     numeric_df = df.select_dtypes(include=['number'])
     # Only compute correlations if the target column is numeric
     if target in numeric_df.columns:
-        return numeric_df.corr()[target].sort_values(ascending=False)
+        return numerical_relationships(numeric_df, [target], method)[target].sort_values(ascending=False)
     else:
         # If target is not numeric, we can't correlate with it, return empty series
         return pd.Series(dtype=float)
@@ -29,3 +48,170 @@ def categorical_relationship(df, target):
             stat = df.groupby(col)[target].value_counts()
         result[col] = stat
     return result
+
+
+def _rank_correlations(numeric_df, targets, method, n_bins=64):
+    # Kendall has no matrix form: one O(n log n) tau (or sketch) per pair
+    values = numeric_df.to_numpy(dtype=float, na_value=np.nan)
+    corr = np.empty((values.shape[1], len(targets)))
+    for j, t in enumerate(targets):
+        y = values[:, numeric_df.columns.get_loc(t)]
+        y_edges = None
+        for i in range(values.shape[1]):
+            if method == "kendall":
+                corr[i, j] = kendall_tau(values[:, i], y)
+            else:
+                sketch = RankCorrelationSketch(n_bins, y_edges=y_edges).update(values[:, i], y)
+                y_edges = sketch.y_edges
+                corr[i, j] = sketch.kendall()
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=targets)
+
+
+def _pairwise_correlations(values, target_idx):
+    """
+    Pairwise-complete Pearson correlations of every column with the target
+    columns, from masked sums: O(n * p * k) instead of a p x p matrix.
+    ``values`` is overwritten.
+    """
+    valid = ~np.isnan(values)
+    # Shift each column by one of its own values: limits cancellation in the
+    # sums and keeps constant columns exactly zero
+    first = values[valid.argmax(axis=0), np.arange(values.shape[1])]
+    values -= np.nan_to_num(first)
+    values[~valid] = 0.0
+    mask = valid.astype(float)
+    del valid
+
+    y, y_mask = values[:, target_idx].copy(), mask[:, target_idx].copy()
+    n = mask.T @ y_mask
+    sum_x, sum_y, sum_yy = values.T @ y_mask, mask.T @ y, mask.T @ (y * y)
+    del mask
+    sum_xy = values.T @ y
+    values *= values
+    sum_xx = values.T @ y_mask
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_xy - sum_x * sum_y / n
+        var_x = sum_xx - sum_x ** 2 / n
+        var_y = sum_yy - sum_y ** 2 / n
+        corr = cov / np.sqrt(var_x * var_y)
+    corr[(n < 2) | (var_x <= 0) | (var_y <= 0)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def numerical_relationships(df, targets, method="pearson"):
+    """
+    Correlations of every numeric column with several numeric targets at once.
+
+    One standardized matrix product replaces a ``DataFrame.corr()`` call per
+    target. With missing values, correlations are pairwise-complete and
+    come from masked sums against the target columns only, so the cost
+    stays O(n * p * k). For "spearman" each column is ranked once (over its
+    own non-null values) and the ranks go through the same computation;
+    "kendall" and "kendall_approx" are computed per pair (see
+    ``numerical_relationship``).
+
+    Args:
+        df: Input dataframe
+        targets: List of target column names (non-numeric ones are ignored)
+        method: Correlation method (default "pearson")
+
+    Returns:
+        pd.DataFrame: One column of correlations per numeric target
+    """
+    _check_method(method)
+    numeric_df = df.select_dtypes(include=['number'])
+    targets = [t for t in targets if t in numeric_df.columns]
+    if not targets:
+        return pd.DataFrame(index=numeric_df.columns, dtype=float)
+    if method in ("kendall", "kendall_approx"):
+        return _rank_correlations(numeric_df, targets, method)
+
+    ranked = spearman_ranks(numeric_df) if method == "spearman" else numeric_df
+    values = ranked.to_numpy(dtype=float, na_value=np.nan, copy=True)
+    del ranked
+    target_idx = [numeric_df.columns.get_loc(t) for t in targets]
+    if np.isnan(values).any():
+        corr = _pairwise_correlations(values, target_idx)
+        return pd.DataFrame(corr, index=numeric_df.columns, columns=targets)
+
+    # Standardize in place: one copy of the data is all the memory used
+    values -= values.mean(axis=0)
+    norms = np.sqrt(np.einsum('ij,ij->j', values, values))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values /= norms
+    corr = np.clip(values.T @ values[:, target_idx], -1.0, 1.0)
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=targets)
+
+
+def categorical_relationships(df, targets):
+    """
+    Categorical-vs-target tables for several targets at once.
+
+    Each categorical column is factorized once; numeric targets share one
+    groupby-mean over the codes and categorical targets are counted with
+    ``np.bincount`` on joint codes.
+
+    Args:
+        df: Input dataframe
+        targets: List of target column names
+
+    Returns:
+        dict: {target: {categorical column: table}} in the same format as
+        ``categorical_relationship``
+    """
+    result = {t: {} for t in targets}
+    cat_cols = df.select_dtypes(include=["object", "category"]).columns
+    numeric_targets = [t for t in targets if df[t].dtype in ['int64', 'float64']]
+    cat_targets = {}
+    for t in targets:
+        if t not in numeric_targets:
+            codes, uniques = pd.factorize(df[t], sort=True)
+            cat_targets[t] = (codes, uniques)
+
+    for col in cat_cols:
+        codes, uniques = pd.factorize(df[col], sort=True)
+        valid = codes >= 0
+        group_index = pd.Index(uniques, name=col)
+
+        own_numeric = [t for t in numeric_targets if t != col]
+        if own_numeric:
+            means = df.loc[valid, own_numeric].groupby(codes[valid]).mean()
+            means.index = group_index[means.index]
+            for t in own_numeric:
+                result[t][col] = means[t]
+
+        for t, (y_codes, y_uniques) in cat_targets.items():
+            if t == col:
+                continue
+            ky = len(y_uniques)
+            both = valid & (y_codes >= 0)
+            counts = np.bincount(codes[both] * ky + y_codes[both],
+                                 minlength=len(uniques) * ky).reshape(len(uniques), ky)
+            result[t][col] = count_table_to_series(counts, uniques, y_uniques, col, t)
+    return result
+
+
+def count_table_to_series(counts, row_labels, col_labels, row_name, col_name):
+    """
+    Convert a contingency table into the ``groupby(...).value_counts()`` layout.
+
+    Args:
+        counts: 2-D array of counts (rows = groups, columns = target values)
+        row_labels: Group labels, one per row
+        col_labels: Target labels, one per column
+        row_name: Name of the grouping column
+        col_name: Name of the target column
+
+    Returns:
+        pd.Series: Non-zero counts indexed by (group, target value), sorted
+        by count within each group
+    """
+    counts = np.asarray(counts)
+    rows, cols = np.nonzero(counts)
+    order = np.lexsort((-counts[rows, cols], rows))
+    rows, cols = rows[order], cols[order]
+    index = pd.MultiIndex.from_arrays(
+        [pd.Index(row_labels).take(rows), pd.Index(col_labels).take(cols)],
+        names=[row_name, col_name])
+    return pd.Series(counts[rows, cols], index=index, name="count")
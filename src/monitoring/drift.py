@@ -0,0 +1,359 @@
+"""
+Rolling-window statistics and drift monitoring for live feeds.
+
+A ``ReferenceProfile`` summarizes a baseline frame: quantile bin edges and
+bin frequencies for numeric columns, category frequencies for the others,
+plus means, standard deviations and null rates. A ``WindowedMonitor`` then
+ingests batches of rows and keeps running sums, null counts and bin counts
+for a count- or time-based window. Rows leaving the window are subtracted
+from those totals, so each update costs time proportional to the batch
+size, never to the window size. Drift against the reference (PSI, KS on the
+binned sketches, mean-shift z-score, null-rate change) is read off the
+running totals. When rows much larger than the current window have passed
+through, the running moments are recomputed from the retained rows so that
+cancellation error does not build up.
+"""
+import datetime
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_THRESHOLDS = {
+    'psi': 0.2,
+    'ks': 0.1,
+    'mean_shift_z': 3.0,
+    'null_rate_delta': 0.1,
+}
+
+_EPS = 1e-6
+
+# Recompute the running moments once the squares added and subtracted since
+# the last rebuild exceed the current total by this factor
+_REBUILD_RATIO = 1e6
+
+
+def psi(expected, actual):
+    """
+    Population stability index between two frequency vectors.
+
+    Args:
+        expected: Reference bin proportions (or counts)
+        actual: Current bin proportions (or counts)
+
+    Returns:
+        float: PSI; values above 0.2 usually indicate a significant shift
+    """
+    expected = np.asarray(expected, dtype=float)
+    actual = np.asarray(actual, dtype=float)
+    expected = np.clip(expected / max(expected.sum(), _EPS), _EPS, None)
+    actual = np.clip(actual / max(actual.sum(), _EPS), _EPS, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_statistic(expected, actual):
+    """Kolmogorov-Smirnov distance between two binned distributions."""
+    expected = np.asarray(expected, dtype=float)
+    actual = np.asarray(actual, dtype=float)
+    if expected.sum() == 0 or actual.sum() == 0:
+        return np.nan
+    return float(np.max(np.abs(np.cumsum(expected) / expected.sum()
+                               - np.cumsum(actual) / actual.sum())))
+
+
+class ReferenceProfile:
+    """Baseline column profile that drift is measured against."""
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def from_frame(cls, df, n_bins=20, max_categories=50):
+        """
+        Build a reference profile from a baseline dataframe.
+
+        Args:
+            df: Baseline dataframe
+            n_bins: Quantile bins per numeric column (default 20)
+            max_categories: Most frequent categories tracked per categorical
+                column; the rest share an "other" bin (default 50)
+
+        Returns:
+            ReferenceProfile
+        """
+        columns = {}
+        for col in df.columns:
+            series = df[col]
+            null_rate = float(series.isnull().mean()) if len(series) else 0.0
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                values = series.to_numpy(dtype=float, na_value=np.nan)
+                values = values[~np.isnan(values)]
+                if values.size:
+                    interior = np.linspace(0, 1, n_bins + 1)[1:-1]
+                    edges = np.unique(np.quantile(values, interior))
+                    mean = float(values.mean())
+                    std = float(values.std(ddof=1)) if values.size > 1 else 0.0
+                else:
+                    edges, mean, std = np.array([]), 0.0, 0.0
+                counts = np.bincount(np.searchsorted(edges, values, side='right'),
+                                     minlength=len(edges) + 1)
+                columns[col] = {'kind': 'numeric', 'edges': edges, 'mean': mean, 'std': std,
+                                'null_rate': null_rate, 'frequencies': counts / max(counts.sum(), 1)}
+            else:
+                top = series.value_counts().head(max_categories)
+                categories = top.index.tolist()
+                counts = np.append(top.to_numpy(), series.notna().sum() - top.sum())
+                columns[col] = {'kind': 'categorical', 'categories': categories,
+                                'null_rate': null_rate, 'frequencies': counts / max(counts.sum(), 1)}
+        return cls(columns)
+
+    def n_codes(self, col):
+        return len(self.columns[col]['frequencies'])
+
+
+class WindowedMonitor:
+    """
+    Rolling-window column statistics with drift alerts.
+
+    Args:
+        reference: ``ReferenceProfile`` (or a dataframe to build one from)
+        window: Window size: number of rows, or a duration (``pd.Timedelta``,
+            ``datetime.timedelta`` or string such as ``"5min"``) for time windows
+        time_column: Column holding row timestamps for time windows; if
+            omitted, ``update`` uses the ``timestamps`` argument or the
+            ingestion time
+        thresholds: Alert thresholds overriding ``DEFAULT_THRESHOLDS``
+        min_count: Minimum rows in the window before alerts are raised
+        on_alert: Optional callback invoked with each new alert dict
+        check_every: Check thresholds on every n-th update only; raise it
+            for high-rate feeds of small batches (default 1)
+    """
+
+    def __init__(self, reference, window=10000, time_column=None, thresholds=None,
+                 min_count=100, on_alert=None, check_every=1):
+        if isinstance(reference, pd.DataFrame):
+            reference = ReferenceProfile.from_frame(reference)
+        self.reference = reference
+        # Only durations are time windows; any other number is a row count
+        self.time_based = isinstance(window, (str, datetime.timedelta, np.timedelta64))
+        self.window = pd.Timedelta(window).value if self.time_based else int(window)
+        self.time_column = time_column
+        self.thresholds = dict(DEFAULT_THRESHOLDS, **(thresholds or {}))
+        self.min_count = min_count
+        self.on_alert = on_alert
+        self.check_every = check_every
+        self._updates = 0
+
+        self.columns = [c for c in reference.columns if c != time_column]
+        self.numeric = [c for c in self.columns if reference.columns[c]['kind'] == 'numeric']
+        self._numeric_index = [i for i, c in enumerate(self.columns) if c in self.numeric]
+        self._categories = {c: pd.Index(reference.columns[c]['categories'])
+                            for c in self.columns if c not in self.numeric}
+        self._shift = np.array([reference.columns[c]['mean'] for c in self.numeric])
+        self._ref_std = np.array([reference.columns[c]['std'] for c in self.numeric])
+        self._ref_null_rate = np.array([reference.columns[c]['null_rate'] for c in self.columns])
+        self._ref_frequencies = np.concatenate([reference.columns[c]['frequencies'] for c in self.columns])
+        sizes = [reference.n_codes(c) for c in self.columns]
+        self._offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+        self._blocks = deque()
+        self.rows = 0
+        self._count = np.zeros(len(self.numeric))
+        self._sum = np.zeros(len(self.numeric))
+        self._sumsq = np.zeros(len(self.numeric))
+        self._sumsq_moved = np.zeros(len(self.numeric))
+        self._nulls = np.zeros(len(self.columns))
+        self._bins = np.zeros(self._offsets[-1])
+        self._active = set()
+
+    # -- ingestion ----------------------------------------------------------
+
+    def _encode(self, df):
+        """Centered numeric values and flat bin codes (-1 for nulls) of a batch."""
+        values = np.empty((len(df), len(self.numeric)))
+        codes = np.empty((len(df), len(self.columns)), dtype=np.int64)
+        j = 0
+        for i, col in enumerate(self.columns):
+            ref = self.reference.columns[col]
+            if ref['kind'] == 'numeric':
+                x = df[col].to_numpy(dtype=float, na_value=np.nan)
+                null = np.isnan(x)
+                values[:, j] = x - self._shift[j]
+                j += 1
+                col_codes = np.searchsorted(ref['edges'], x, side='right')
+            else:
+                null = df[col].isnull().to_numpy()
+                col_codes = self._categories[col].get_indexer(df[col]).astype(np.int64)
+                col_codes[col_codes < 0] = len(ref['categories'])
+            codes[:, i] = np.where(null, -1, col_codes + self._offsets[i])
+        return values, codes
+
+    def _apply(self, values, codes, sign):
+        present = ~np.isnan(values)
+        self._count += sign * present.sum(axis=0)
+        self._sum += sign * np.where(present, values, 0.0).sum(axis=0)
+        squares = np.where(present, values * values, 0.0).sum(axis=0)
+        self._sumsq += sign * squares
+        self._sumsq_moved += squares
+        self._nulls += sign * (codes < 0).sum(axis=0)
+        flat = codes[codes >= 0]
+        self._bins += sign * np.bincount(flat, minlength=len(self._bins))
+        self.rows += sign * len(codes)
+
+    def _evict(self, now):
+        while self._blocks:
+            timestamps, values, codes = self._blocks[0]
+            if self.time_based:
+                expired = int(np.searchsorted(timestamps, now - self.window, side='right'))
+            else:
+                expired = self.rows - self.window
+            if expired <= 0:
+                break
+            if expired >= len(codes):
+                self._apply(values, codes, -1)
+                self._blocks.popleft()
+            else:
+                self._apply(values[:expired], codes[:expired], -1)
+                self._blocks[0] = (None if timestamps is None else timestamps[expired:],
+                                   values[expired:], codes[expired:])
+                break
+        if np.any(self._sumsq_moved > _REBUILD_RATIO * self._sumsq):
+            self._rebuild()
+
+    def _rebuild(self):
+        """Recompute the float running moments exactly from the retained rows."""
+        values = (np.concatenate([block[1] for block in self._blocks]) if self._blocks
+                  else np.empty((0, len(self.numeric))))
+        present = ~np.isnan(values)
+        self._sum = np.where(present, values, 0.0).sum(axis=0)
+        self._sumsq = np.where(present, values * values, 0.0).sum(axis=0)
+        self._sumsq_moved = self._sumsq.copy()
+
+    def update(self, batch, timestamps=None):
+        """
+        Ingest a batch of rows and slide the window.
+
+        Args:
+            batch: Dataframe with the reference columns
+            timestamps: Row timestamps for time windows when no
+                ``time_column`` is set (default: ingestion time)
+
+        Returns:
+            list: Alerts newly raised by this update (empty when the
+            update is skipped by ``check_every``)
+        """
+        if len(batch) == 0:
+            return []
+        values, codes = self._encode(batch)
+
+        ts = None
+        if self.time_based:
+            if self.time_column is not None:
+                ts = pd.to_datetime(batch[self.time_column]).to_numpy(dtype='datetime64[ns]')
+            elif timestamps is not None:
+                ts = pd.to_datetime(np.asarray(timestamps)).to_numpy(dtype='datetime64[ns]')
+            else:
+                ts = np.full(len(batch), pd.Timestamp.now().to_datetime64(), dtype='datetime64[ns]')
+            ts = ts.astype(np.int64)
+            if np.any(np.diff(ts) < 0):
+                order = np.argsort(ts, kind='stable')
+                ts, values, codes = ts[order], values[order], codes[order]
+
+        self._apply(values, codes, 1)
+        self._blocks.append((ts, values, codes))
+        self._evict(ts[-1] if ts is not None else None)
+        self._updates += 1
+        if self._updates % self.check_every:
+            return []
+        return self.check()
+
+    # -- statistics ---------------------------------------------------------
+
+    def window_stats(self):
+        """
+        Current window statistics per column.
+
+        Returns:
+            pd.DataFrame: count, mean, std and null_rate per column
+        """
+        stats = pd.DataFrame(index=pd.Index(self.columns, name='column'),
+                             columns=['count', 'mean', 'std', 'null_rate'], dtype=float)
+        stats['null_rate'] = self._nulls / self.rows if self.rows else np.nan
+        stats['count'] = self.rows - self._nulls
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = self._sum / self._count
+            var = (self._sumsq - self._count * mean ** 2) / (self._count - 1)
+        stats.loc[self.numeric, 'mean'] = mean + self._shift
+        stats.loc[self.numeric, 'std'] = np.sqrt(np.clip(var, 0, None))
+        return stats
+
+    def _scores(self):
+        """Drift scores as arrays aligned with ``self.columns``, read off the running totals."""
+        starts = self._offsets[:-1]
+        sizes = np.diff(self._offsets)
+
+        # Per-column proportions of the flat bin vector, vectorized over columns
+        totals = np.add.reduceat(self._bins, starts)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            actual = self._bins / np.repeat(totals, sizes)
+
+        def segment_cumsum(values):
+            cum = np.cumsum(values)
+            return cum - np.repeat(cum[starts] - values[starts], sizes)
+
+        expected = self._ref_frequencies
+        e = np.clip(expected, _EPS, None)
+        a = np.clip(actual, _EPS, None)
+        psi_scores = np.add.reduceat((a - e) * np.log(a / e), starts)
+        ks_scores = np.maximum.reduceat(np.abs(segment_cumsum(expected) - segment_cumsum(actual)), starts)
+        empty = totals == 0
+        psi_scores[empty] = np.nan
+        ks_scores[empty] = np.nan
+
+        mean_shift_z = np.full(len(self.columns), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Running sums are centered on the reference mean
+            z = (self._sum / self._count) / (self._ref_std / np.sqrt(self._count))
+        mean_shift_z[self._numeric_index] = np.where(np.isfinite(z), z, np.nan)
+        null_rate = self._nulls / self.rows if self.rows else np.full(len(self.columns), np.nan)
+        return {'psi': psi_scores, 'ks': ks_scores, 'mean_shift_z': mean_shift_z,
+                'null_rate_delta': np.abs(null_rate - self._ref_null_rate)}
+
+    def drift(self):
+        """
+        Drift scores of the current window against the reference profile.
+
+        Returns:
+            pd.DataFrame: psi, ks, mean_shift_z and null_rate_delta per column
+        """
+        return pd.DataFrame(self._scores(), index=pd.Index(self.columns, name='column'))
+
+    def check(self):
+        """
+        Compare drift scores with the thresholds.
+
+        An alert is raised once when a metric crosses its threshold and is
+        re-armed when the metric falls back below it.
+
+        Returns:
+            list: Newly raised alerts as dicts (column, metric, value, threshold)
+        """
+        if self.rows < self.min_count:
+            return []
+        scores = self._scores()
+        alerts = []
+        breached = set()
+        for metric, threshold in self.thresholds.items():
+            values = scores[metric]
+            magnitude = np.abs(values) if metric == 'mean_shift_z' else values
+            for i in np.flatnonzero(magnitude > threshold):
+                col = self.columns[i]
+                breached.add((col, metric))
+                if (col, metric) not in self._active:
+                    alerts.append({'column': col, 'metric': metric,
+                                   'value': float(values[i]), 'threshold': threshold})
+        self._active = breached
+        if self.on_alert is not None:
+            for alert in alerts:
+                self.on_alert(alert)
+        return alerts
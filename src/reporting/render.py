@@ -0,0 +1,205 @@
+"""
+Terminal and HTML rendering of EDA insights.
+
+Both renderers accept an insights dict or a loaded ``Report`` and truncate
+long Series, DataFrames and dicts, so tables with thousands of columns stay
+readable and fast to render.
+"""
+import html
+import os
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+from rich.markup import escape
+from rich.panel import Panel
+from rich.table import Table
+
+
+def _is_scalar(value):
+    return value is None or np.isscalar(value)
+
+
+def _format_scalar(value):
+    if isinstance(value, (float, np.floating)):
+        return f"{value:.4g}"
+    return str(value)
+
+
+def _summarize(value):
+    """Short one-cell description of any insight value."""
+    if _is_scalar(value):
+        return _format_scalar(value)
+    if isinstance(value, pd.Series):
+        return f"<Series: {len(value)} entries>"
+    if isinstance(value, pd.DataFrame):
+        return f"<DataFrame: {value.shape[0]} x {value.shape[1]}>"
+    if isinstance(value, dict):
+        return f"<dict: {len(value)} entries>"
+    if isinstance(value, (list, tuple)):
+        shown = ", ".join(_format_scalar(v) if _is_scalar(v) else "..." for v in value[:5])
+        return f"[{shown}{', ...' if len(value) > 5 else ''}]"
+    return str(value)
+
+
+def _cell(value):
+    """Table cell text; small dicts of scalars are shown inline."""
+    if isinstance(value, dict) and len(value) <= 5 and all(_is_scalar(v) for v in value.values()):
+        return ", ".join(f"{k}={_format_scalar(v)}" for k, v in value.items())
+    return _summarize(value)
+
+
+def _rows(value, max_rows):
+    """
+    Table layout for one insight value.
+
+    Returns:
+        tuple: (header list, list of row lists, number of hidden rows)
+    """
+    if isinstance(value, pd.Series):
+        index_name = ", ".join(str(n) for n in value.index.names if n is not None) or "index"
+        head = value.head(max_rows)
+        rows = [[", ".join(map(str, k)) if isinstance(k, tuple) else str(k), _summarize(v)]
+                for k, v in head.items()]
+        return [index_name, str(value.name) if value.name is not None else "value"], rows, len(value) - len(head)
+    if isinstance(value, pd.DataFrame):
+        head = value.head(max_rows)
+        rows = [[str(k)] + [_summarize(v) for v in row] for k, row in zip(head.index, head.to_numpy())]
+        return ["index"] + [str(c) for c in value.columns], rows, len(value) - len(head)
+    if isinstance(value, dict):
+        items = list(value.items())[:max_rows]
+        hidden = len(value) - len(items)
+        if items and all(isinstance(v, dict) for _, v in items):
+            # Dict of records, e.g. distribution fits: one column per field
+            fields = list(items[0][1])
+            rows = [[str(k)] + [_cell(v.get(f)) for f in fields] for k, v in items]
+            return ["key"] + fields, rows, hidden
+        return ["key", "value"], [[str(k), _cell(v)] for k, v in items], hidden
+    return ["value"], [[_summarize(value)]], 0
+
+
+def _rich_table(value, max_rows):
+    header, rows, hidden = _rows(value, max_rows)
+    table = Table(show_header=True, header_style="bold magenta", box=None)
+    for i, name in enumerate(header):
+        table.add_column(escape(name), style="cyan" if i == 0 else None, overflow="fold")
+    for row in rows:
+        table.add_row(*(escape(cell) for cell in row))
+    if hidden:
+        table.caption = f"... {hidden} more"
+    return table
+
+
+def render_insights(insights, console=None, max_rows=20, max_nested=5, page=False):
+    """
+    Print insights as truncated tables, one panel per stage.
+
+    Args:
+        insights: Insights dict or loaded ``Report``
+        console: rich Console (default: a new one)
+        max_rows: Maximum rows shown per table (default 20)
+        max_nested: Maximum nested tables shown for dicts of Series (default 5)
+        page: Send the output through the system pager (default False)
+    """
+    console = console or Console()
+
+    def _print():
+        for stage, value in insights.items():
+            title = f"[bold]{escape(stage.upper())}[/bold]"
+            if isinstance(value, dict) and value and all(
+                    isinstance(v, (pd.Series, pd.DataFrame)) for v in value.values()):
+                # Dict of tables, e.g. categorical relationships
+                tables = Table.grid(padding=(0, 0, 1, 0))
+                for key, item in list(value.items())[:max_nested]:
+                    tables.add_row(f"[bold]{escape(str(key))}[/bold]")
+                    tables.add_row(_rich_table(item, max_rows))
+                if len(value) > max_nested:
+                    tables.add_row(f"... {len(value) - max_nested} more")
+                console.print(Panel(tables, title=title, border_style="blue"))
+            else:
+                console.print(Panel(_rich_table(value, max_rows), title=title, border_style="blue"))
+
+    if page:
+        with console.pager(styles=True):
+            _print()
+    else:
+        _print()
+
+
+def _html_table(value, max_rows):
+    header, rows, hidden = _rows(value, max_rows)
+    parts = ["<table><thead><tr>"]
+    parts += [f"<th>{html.escape(h)}</th>" for h in header]
+    parts.append("</tr></thead><tbody>")
+    for row in rows:
+        parts.append("<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>")
+    parts.append("</tbody></table>")
+    if hidden:
+        parts.append(f'<p class="more">... {hidden} more</p>')
+    return "".join(parts)
+
+
+_HTML_STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #222; }
+h1 { color: #1f4e79; }
+section { margin-bottom: 2em; }
+table { border-collapse: collapse; margin: 0.5em 0; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: left; }
+th { background: #f0f0f0; }
+.more { color: #888; font-style: italic; }
+img { max-width: 100%; margin: 1em 0; border: 1px solid #eee; }
+"""
+
+
+def write_html_report(insights, path, images_dir=None, title="EDA Report", max_rows=50,
+                      max_nested=20):
+    """
+    Write a self-contained HTML report.
+
+    Tables are truncated to ``max_rows``. Plots are not embedded; PNG files
+    found in ``images_dir`` or listed in a ``visualizations`` stage are
+    referenced by path relative to the report.
+
+    Args:
+        insights: Insights dict or loaded ``Report``
+        path: Output HTML path
+        images_dir: Directory of visualization PNGs (optional)
+        title: Page title
+        max_rows: Maximum rows per table (default 50)
+        max_nested: Maximum nested tables shown for dicts of Series (default 20)
+    """
+    report_dir = os.path.dirname(os.path.abspath(path))
+    images = []
+    if images_dir and os.path.isdir(images_dir):
+        images = [os.path.join(images_dir, f) for f in sorted(os.listdir(images_dir))
+                  if f.lower().endswith(".png")]
+
+    body = [f"<h1>{html.escape(title)}</h1>"]
+    for stage, value in insights.items():
+        if stage == "visualizations":
+            # Plot paths recorded by full_eda(report_path=...)
+            images += [p for p in value if p not in images]
+            continue
+        body.append(f"<section><h2>{html.escape(stage)}</h2>")
+        if isinstance(value, dict) and value and all(
+                isinstance(v, (pd.Series, pd.DataFrame)) for v in value.values()):
+            for key, item in list(value.items())[:max_nested]:
+                body.append(f"<h3>{html.escape(str(key))}</h3>{_html_table(item, max_rows)}")
+            if len(value) > max_nested:
+                body.append(f'<p class="more">... {len(value) - max_nested} more</p>')
+        else:
+            body.append(_html_table(value, max_rows))
+        body.append("</section>")
+
+    if images:
+        body.append("<section><h2>visualizations</h2>")
+        for image in images:
+            src = os.path.relpath(os.path.abspath(image), report_dir).replace(os.sep, "/")
+            body.append(f'<img src="{html.escape(src)}" alt="{html.escape(os.path.basename(image))}">')
+        body.append("</section>")
+
+    document = (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+                f"<title>{html.escape(title)}</title><style>{_HTML_STYLE}</style></head>"
+                f"<body>{''.join(body)}</body></html>")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(document)
@@ -0,0 +1,287 @@
+"""
+Versioned, streamable storage for EDA insights.
+
+A report is a JSON Lines file: a header line, one line per insight stage in
+the order stages complete, and a footer line holding the byte offset of
+every stage. Series and DataFrames are stored column-wise (index levels and
+values as separate arrays), so reports stay compact and can be queried one
+stage at a time without re-running EDA or parsing the whole file.
+Non-finite floats are stored as tagged values (``{"__float__": "nan"}``),
+so every line is standard JSON.
+"""
+import datetime
+import json
+import math
+import re
+
+import numpy as np
+import pandas as pd
+
+REPORT_FORMAT = "smarteda-report"
+REPORT_FORMAT_VERSION = 1
+
+_STAGE_PATTERN = re.compile(rb'^\{"stage": ("(?:[^"\\]|\\.)*")')
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+_NONFINITE = {"nan": math.nan, "inf": math.inf, "-inf": -math.inf}
+
+
+def _encode_float(x):
+    if math.isfinite(x):
+        return x
+    return {"__float__": "nan" if x != x else ("inf" if x > 0 else "-inf")}
+
+
+def _encode_array(values):
+    values = np.asarray(values)
+    items = values.tolist()
+    if values.dtype.kind == "f":
+        if np.isfinite(values).all():
+            return items
+        return [_encode_float(x) for x in items]
+    if values.dtype.kind == "O":
+        return [_encode_float(x) if isinstance(x, float) else x for x in items]
+    return items
+
+
+def _decode_array(items):
+    return [decode_value(x) if isinstance(x, dict) else x for x in items]
+
+
+def _encode_index(index):
+    return {
+        "names": [None if name is None else str(name) for name in index.names],
+        "levels": [_encode_array(index.get_level_values(i)) for i in range(index.nlevels)],
+    }
+
+
+def _numeric_dtype(name):
+    """numpy dtype for numeric/bool/datetime names, None for everything else."""
+    try:
+        dtype = np.dtype(name)
+    except TypeError:
+        return None
+    return dtype if dtype.kind in "biufM" else None
+
+
+def _decode_index(data):
+    if len(data["levels"]) == 1:
+        return pd.Index(_decode_array(data["levels"][0]), name=data["names"][0])
+    return pd.MultiIndex.from_arrays([_decode_array(level) for level in data["levels"]],
+                                     names=data["names"])
+
+
+def encode_value(value):
+    """Convert an insight value into JSON-compatible, column-oriented data."""
+    if isinstance(value, pd.Series):
+        return {"__series__": {"name": None if value.name is None else str(value.name),
+                               "index": _encode_index(value.index),
+                               "dtype": str(value.dtype),
+                               "values": _encode_array(value.to_numpy())}}
+    if isinstance(value, pd.DataFrame):
+        return {"__frame__": {"index": _encode_index(value.index),
+                              "columns": [str(col) for col in value.columns],
+                              "dtypes": [str(dtype) for dtype in value.dtypes],
+                              "data": [_encode_array(value[col].to_numpy()) for col in value.columns]}}
+    if isinstance(value, np.ndarray):
+        return {"__array__": _encode_array(value)}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: encode_value(item) for key, item in value.items()}
+        return {"__items__": [[encode_value(key), encode_value(item)] for key, item in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    if isinstance(value, np.generic):
+        return encode_value(value.item())
+    if isinstance(value, float):
+        return _encode_float(value)
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    return str(value)
+
+
+def decode_value(data):
+    """Inverse of ``encode_value``."""
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "__series__" in data:
+        series = data["__series__"]
+        return pd.Series(_decode_array(series["values"]), index=_decode_index(series["index"]), name=series["name"],
+                         dtype=_numeric_dtype(series["dtype"]))
+    if "__frame__" in data:
+        frame = data["__frame__"]
+        columns = {col: pd.Series(_decode_array(values), dtype=_numeric_dtype(dtype))
+                   for col, values, dtype in zip(frame["columns"], frame["data"], frame["dtypes"])}
+        index = _decode_index(frame["index"])
+        return pd.DataFrame({col: values.set_axis(index) for col, values in columns.items()},
+                            index=index, columns=frame["columns"])
+    if "__array__" in data:
+        return np.asarray(_decode_array(data["__array__"]))
+    if "__float__" in data:
+        return _NONFINITE[data["__float__"]]
+    if "__items__" in data:
+        return {_hashable(decode_value(key)): decode_value(item) for key, item in data["__items__"]}
+    return {key: decode_value(item) for key, item in data.items()}
+
+
+def _hashable(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _dumps(obj):
+    return (json.dumps(obj, separators=(",", ":"), allow_nan=False) + "\n").encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+class ReportWriter:
+    """
+    Stream insight stages to a report file as they complete.
+
+    Each ``write`` call appends and flushes one line, so a crashed run still
+    leaves every finished stage on disk. Use as a context manager or call
+    ``close`` to write the footer index.
+    """
+
+    def __init__(self, path, meta=None):
+        self.path = path
+        self._file = open(path, "wb")
+        self._index = {}
+        header = {
+            "format": REPORT_FORMAT,
+            "version": REPORT_FORMAT_VERSION,
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "meta": encode_value(meta or {}),
+        }
+        self._file.write(_dumps(header))
+        self._file.flush()
+
+    def write(self, stage, value):
+        offset = self._file.tell()
+        # Stage name goes first so readers can index the file without parsing it
+        data = json.dumps(encode_value(value), separators=(",", ":"), allow_nan=False)
+        line = f'{{"stage": {json.dumps(stage)}, "data": {data}}}\n'.encode("utf-8")
+        self._file.write(line)
+        self._file.flush()
+        self._index[stage] = [offset, len(line)]
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write(_dumps({"index": self._index}))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_report(insights, path, meta=None):
+    """Write a complete insights dict to ``path`` in one go."""
+    with ReportWriter(path, meta) as writer:
+        for stage, value in insights.items():
+            writer.write(stage, value)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class Report:
+    """
+    Lazily loaded report.
+
+    Only the header and the stage index are read on open; each stage is
+    read and decoded on first access and then cached.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            if header.get("format") != REPORT_FORMAT:
+                raise ValueError(f"'{path}' is not a {REPORT_FORMAT} file")
+            if header["version"] > REPORT_FORMAT_VERSION:
+                raise ValueError(f"Report version {header['version']} is newer than supported "
+                                 f"version {REPORT_FORMAT_VERSION}")
+            self.version = header["version"]
+            self.created = header["created"]
+            self.meta = decode_value(header["meta"])
+            self._index = self._read_footer(f) or self._scan(f)
+        self._cache = {}
+
+    @staticmethod
+    def _read_footer(f):
+        # Read backwards until the start of the last line
+        f.seek(0, 2)
+        position = f.tell()
+        tail = b""
+        while position > 0:
+            step = min(65536, position)
+            position -= step
+            f.seek(position)
+            tail = f.read(step) + tail
+            if b"\n" in tail.rstrip(b"\n"):
+                break
+        last = tail.rstrip(b"\n").rsplit(b"\n", 1)[-1]
+        if not last.startswith(b'{"index"'):
+            return None
+        return json.loads(last)["index"]
+
+    @staticmethod
+    def _scan(f):
+        # No footer: the writer was interrupted; index the stages it finished
+        index = {}
+        f.seek(0)
+        f.readline()
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            if not line.endswith(b"\n"):
+                break
+            match = _STAGE_PATTERN.match(line)
+            if match:
+                index[json.loads(match.group(1))] = [offset, len(line)]
+        return index
+
+    def keys(self):
+        return list(self._index)
+
+    def __contains__(self, stage):
+        return stage in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, stage):
+        if stage not in self._cache:
+            offset, length = self._index[stage]
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                line = json.loads(f.read(length))
+            self._cache[stage] = decode_value(line["data"])
+        return self._cache[stage]
+
+    def items(self):
+        return ((stage, self[stage]) for stage in self._index)
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+def load_report(path):
+    """Open a report for lazy, per-stage access."""
+    return Report(path)
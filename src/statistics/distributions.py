@@ -1,4 +1,10 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+from scipy import stats as _stats
 from scipy.stats import norm
 
 
@@ -29,3 +35,297 @@ def analyze_distribution(data):
     }
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# Multi-distribution fitting
+# ---------------------------------------------------------------------------
+
+# Candidate distributions screened for every numeric column
+DISTRIBUTION_CANDIDATES = ("norm", "lognorm", "gamma", "expon", "beta", "uniform")
+
+# Below this many cells the process pool costs more than it saves
+_PARALLEL_MIN_CELLS = 1_000_000
+
+
+def column_summary(values, n_bins=50, sample_size=2000, seed=0):
+    """
+    Compute the shared summary every candidate distribution is scored from.
+
+    Moments, log-moments, quantiles and a histogram are computed once per
+    column; a small random sample is kept for the MLE refinement step.
+
+    Args:
+        values: 1-D array-like of numeric values (NaN is ignored)
+        n_bins: Number of equal-width histogram bins
+        sample_size: Maximum number of values kept for MLE fitting
+        seed: Random seed used to draw the sample
+
+    Returns:
+        dict: Summary statistics, or None if the column has fewer than two
+        distinct values
+    """
+    x = np.asarray(values, dtype=float)
+    x = x[~np.isnan(x)]
+    n = x.size
+    if n < 2:
+        return None
+
+    lo, hi = x.min(), x.max()
+    if lo == hi:
+        return None
+
+    mean = x.mean()
+    centered = x - mean
+    var = np.dot(centered, centered) / (n - 1)
+    m2 = var * (n - 1) / n
+    skew = (centered ** 3).mean() / m2 ** 1.5
+    kurt = (centered ** 4).mean() / m2 ** 2 - 3
+
+    edges = np.linspace(lo, hi, n_bins + 1)
+    counts = np.histogram(x, edges)[0]
+
+    summary = {
+        'n': n,
+        'mean': mean,
+        'var': var,
+        'skew': skew,
+        'kurt': kurt,
+        'min': lo,
+        'max': hi,
+        'quantiles': np.quantile(x, [0.25, 0.5, 0.75]),
+        'edges': edges,
+        'counts': counts,
+        'log_mean': None,
+        'log_std': None,
+    }
+    if lo > 0:
+        logs = np.log(x)
+        summary['log_mean'] = logs.mean()
+        summary['log_std'] = logs.std(ddof=1)
+
+    rng = np.random.default_rng(seed)
+    summary['sample'] = x if n <= sample_size else rng.choice(x, sample_size, replace=False)
+    return summary
+
+
+def _initial_estimates(name, s):
+    """Moment/quantile estimates for one candidate as (method, args) pairs."""
+    mean, var, lo, hi = s['mean'], s['var'], s['min'], s['max']
+    std = np.sqrt(var)
+
+    if name == "norm":
+        q1, q2, q3 = s['quantiles']
+        estimates = [("moments", (mean, std))]
+        if q3 > q1:
+            estimates.append(("quantiles", (q2, (q3 - q1) / 1.349)))
+        return estimates
+    if name == "uniform":
+        return [("moments", (lo, hi - lo))]
+    if name == "expon":
+        return [("moments", (lo, mean - lo))] if mean > lo else []
+    if name == "lognorm":
+        if s['log_std'] is None or s['log_std'] <= 0:
+            return []
+        return [("moments", (s['log_std'], 0.0, np.exp(s['log_mean'])))]
+    if name == "gamma":
+        if lo <= 0:
+            return []
+        return [("moments", (mean ** 2 / var, 0.0, var / mean))]
+    if name == "beta":
+        pad = (hi - lo) * 1e-3
+        loc, scale = lo - pad, (hi - lo) + 2 * pad
+        m, v = (mean - loc) / scale, var / scale ** 2
+        common = m * (1 - m) / v - 1
+        if common <= 0:
+            return []
+        return [("moments", (m * common, (1 - m) * common, loc, scale))]
+    return []
+
+
+def _goodness_of_fit(cdf_matrix, s):
+    """
+    Binned Kolmogorov-Smirnov and Anderson-Darling statistics.
+
+    ``cdf_matrix`` holds one row of model CDF values at the histogram edges
+    per candidate, so every candidate is scored in a single vectorized pass.
+    """
+    n = s['n']
+    empirical = np.concatenate(([0.0], np.cumsum(s['counts']))) / n
+    diff = empirical - cdf_matrix
+    ks = np.abs(diff).max(axis=1)
+
+    interior = cdf_matrix[:, 1:-1]
+    weight = np.clip(interior * (1 - interior), 1e-12, None)
+    d_cdf = np.diff(cdf_matrix, axis=1)[:, 1:]
+    anderson = n * np.sum(diff[:, 1:-1] ** 2 / weight * np.abs(d_cdf), axis=1)
+    return ks, anderson
+
+
+def _param_dict(dist, args):
+    names = [name.strip() for name in dist.shapes.split(",")] if dist.shapes else []
+    return dict(zip(names + ['loc', 'scale'], (float(a) for a in args)))
+
+
+def _mle_fit(name, args, s):
+    """Refine moment estimates by maximum likelihood on the column sample."""
+    dist = getattr(_stats, name)
+    sample = s['sample']
+    if name in ("lognorm", "gamma"):
+        return dist.fit(sample, args[0], floc=0, scale=args[-1])
+    if name == "beta":
+        # Keep the support fixed so the fit cannot wander outside the data
+        return dist.fit(sample, args[0], args[1], floc=args[2], fscale=args[3])
+    return dist.fit(sample)
+
+
+def _n_params(name):
+    return getattr(_stats, name).numargs + 2  # shapes plus loc and scale
+
+
+def rank_distributions(summary, candidates=None, top_k=2, ks_tolerance=None):
+    """
+    Rank candidate distributions against a column summary.
+
+    All candidates are screened with closed-form moment/quantile estimates
+    and binned goodness-of-fit statistics; only the ``top_k`` best are
+    refined by maximum likelihood. Candidates are ranked by KS statistic,
+    except that the family with the fewest parameters is put first among
+    those within ``ks_tolerance`` of the best, so e.g. uniform data is not
+    reported as a 4-parameter beta.
+
+    Args:
+        summary: Output of ``column_summary``
+        candidates: Distribution names from ``scipy.stats`` (default DISTRIBUTION_CANDIDATES)
+        top_k: Number of screened candidates refined by MLE
+        ks_tolerance: KS differences treated as ties (default
+            ``1 / sqrt(n)``, the order of the statistic's sampling noise)
+
+    Returns:
+        dict: ``best`` distribution name, its ``params``, ``ks`` and
+        ``anderson`` statistics, and the full ``ranking`` list
+    """
+    if summary is None:
+        return {'best': None, 'params': {}, 'ks': None, 'anderson': None, 'ranking': []}
+
+    candidates = candidates or DISTRIBUTION_CANDIDATES
+    edges = summary['edges']
+
+    screened = []
+    for name in candidates:
+        for method, args in _initial_estimates(name, summary):
+            screened.append((name, method, args))
+
+    if not screened:
+        return {'best': None, 'params': {}, 'ks': None, 'anderson': None, 'ranking': []}
+
+    with np.errstate(all='ignore'):
+        cdfs = np.vstack([getattr(_stats, name).cdf(edges, *args) for name, _, args in screened])
+    cdfs = np.nan_to_num(cdfs, nan=0.0)
+    ks, anderson = _goodness_of_fit(cdfs, summary)
+
+    # Keep only the best parameterization of each distribution
+    best_by_name = {}
+    for i in np.argsort(ks, kind='stable'):
+        name, method, args = screened[i]
+        if name not in best_by_name:
+            best_by_name[name] = {'distribution': name, 'method': method, 'args': args,
+                                  'ks': ks[i], 'anderson': anderson[i]}
+    ranking = list(best_by_name.values())
+
+    for entry in ranking[:top_k]:
+        try:
+            with np.errstate(all='ignore'):
+                mle_args = _mle_fit(entry['distribution'], entry['args'], summary)
+                cdf = getattr(_stats, entry['distribution']).cdf(edges, *mle_args)
+        except (ValueError, RuntimeError, FloatingPointError):
+            continue
+        if not np.all(np.isfinite(cdf)):
+            continue
+        mle_ks, mle_ad = _goodness_of_fit(cdf[np.newaxis, :], summary)
+        if mle_ks[0] <= entry['ks']:
+            entry.update(method='mle', args=mle_args, ks=mle_ks[0], anderson=mle_ad[0])
+
+    ranking.sort(key=lambda e: (e['ks'], e['anderson']))
+    if ks_tolerance is None:
+        ks_tolerance = 1 / np.sqrt(summary['n'])
+    tied = [e for e in ranking if e['ks'] <= ranking[0]['ks'] + ks_tolerance]
+    simplest = min(tied, key=lambda e: _n_params(e['distribution']))
+    ranking.remove(simplest)
+    ranking.insert(0, simplest)
+    for entry in ranking:
+        dist = getattr(_stats, entry['distribution'])
+        entry['params'] = _param_dict(dist, entry.pop('args'))
+        entry['ks'] = float(entry['ks'])
+        entry['anderson'] = float(entry['anderson'])
+
+    best = ranking[0]
+    return {
+        'best': best['distribution'],
+        'params': best['params'],
+        'ks': best['ks'],
+        'anderson': best['anderson'],
+        'ranking': ranking,
+    }
+
+
+def _fit_column(job):
+    values, candidates, n_bins, top_k, sample_size, seed = job
+    summary = column_summary(values, n_bins=n_bins, sample_size=sample_size, seed=seed)
+    return rank_distributions(summary, candidates=candidates, top_k=top_k)
+
+
+def fit_distributions(df, candidates=None, n_bins=50, top_k=2, sample_size=2000,
+                      n_jobs=None, random_state=0):
+    """
+    Fit a catalog of distributions to every numeric column of a dataframe.
+
+    Args:
+        df: Input dataframe
+        candidates: Distribution names from ``scipy.stats`` (default DISTRIBUTION_CANDIDATES)
+        n_bins: Histogram bins used for the goodness-of-fit statistics
+        top_k: Number of screened candidates refined by MLE per column
+        sample_size: Maximum number of rows per column used for MLE
+        n_jobs: Worker processes (default: all CPUs for large tables, 1 otherwise).
+            Workers are started with forkserver (spawn where unavailable), so
+            a script that calls this must guard its entry point with
+            ``if __name__ == "__main__":``
+        random_state: Seed for the per-column MLE samples
+
+    Returns:
+        dict: Column name -> ranked best-fit result (see ``rank_distributions``)
+    """
+    columns = list(df.iloc[:0].select_dtypes(include=['number']).columns)
+    if not columns:
+        return {}
+
+    # Columns are converted to float one at a time, as they are fitted, so
+    # at most a few column copies exist at once however wide the frame is
+    jobs = (
+        (df[col].to_numpy(dtype=float, na_value=np.nan), candidates, n_bins,
+         top_k, sample_size, random_state + i)
+        for i, col in enumerate(columns)
+    )
+
+    if n_jobs is None:
+        n_jobs = (os.cpu_count() or 1) if len(df) * len(columns) >= _PARALLEL_MIN_CELLS else 1
+    n_jobs = max(1, min(n_jobs, len(columns)))
+
+    if n_jobs == 1:
+        results = [_fit_column(job) for job in jobs]
+    else:
+        results = []
+        # Never fork: callers may have threads running (e.g. a progress bar)
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        with ProcessPoolExecutor(max_workers=n_jobs,
+                                 mp_context=multiprocessing.get_context(method)) as executor:
+            # Keep two columns per worker in flight, collected in order
+            pending = deque()
+            for job in jobs:
+                if len(pending) >= 2 * n_jobs:
+                    results.append(pending.popleft().result())
+                pending.append(executor.submit(_fit_column, job))
+                del job
+            results += [future.result() for future in pending]
+
+    return dict(zip(columns, results))
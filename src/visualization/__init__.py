@@ -10,9 +10,11 @@ plt.style.use('default')
 sns.set_palette("husl")
 
 
-def plot_missing_values(df: pd.DataFrame, save_path: Optional[str] = None):
-    """Plot missing value percentages for each column."""
-    missing_pct = df.isnull().mean() * 100
+def plot_missing_values(df: pd.DataFrame, save_path: Optional[str] = None,
+                        missing_pct: Optional[pd.Series] = None):
+    """Plot missing value percentages for each column (optionally precomputed)."""
+    if missing_pct is None:
+        missing_pct = df.isnull().mean() * 100
     missing_pct = missing_pct[missing_pct > 0]  # Only show columns with missing values
 
     if len(missing_pct) == 0:
@@ -27,8 +29,10 @@ def plot_missing_values(df: pd.DataFrame, save_path: Optional[str] = None):
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(os.path.join(save_path, 'missing_values.png'), dpi=300, bbox_inches='tight')
+        path = os.path.join(save_path, 'missing_values.png')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
         plt.close()
+        return path
     else:
         plt.show()
 
@@ -65,8 +69,10 @@ def plot_target_distribution(df: pd.DataFrame, target_col: str, save_path: Optio
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(os.path.join(save_path, f'{target_col}_distribution.png'), dpi=300, bbox_inches='tight')
+        path = os.path.join(save_path, f'{target_col}_distribution.png')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
         plt.close()
+        return path
     else:
         plt.show()
 
@@ -92,8 +98,10 @@ def plot_correlation_heatmap(df: pd.DataFrame, target_col: str, save_path: Optio
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(os.path.join(save_path, 'correlation_heatmap.png'), dpi=300, bbox_inches='tight')
+            path = os.path.join(save_path, 'correlation_heatmap.png')
+            plt.savefig(path, dpi=300, bbox_inches='tight')
             plt.close()
+            return path
         else:
             plt.show()
     else:
@@ -124,8 +132,10 @@ def plot_top_features(correlation_series: pd.Series, target_col: str, save_path:
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(os.path.join(save_path, 'top_features.png'), dpi=300, bbox_inches='tight')
+        path = os.path.join(save_path, 'top_features.png')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
         plt.close()
+        return path
     else:
         plt.show()
 
@@ -169,8 +179,10 @@ def plot_categorical_relationships(df: pd.DataFrame, target_col: str, save_path:
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(os.path.join(save_path, 'categorical_relationships.png'), dpi=300, bbox_inches='tight')
+        path = os.path.join(save_path, 'categorical_relationships.png')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
         plt.close()
+        return path
     else:
         plt.show()
 
@@ -207,42 +219,61 @@ def plot_outliers(df: pd.DataFrame, target_col: str, save_path: Optional[str] =
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(os.path.join(save_path, 'outliers.png'), dpi=300, bbox_inches='tight')
+        path = os.path.join(save_path, 'outliers.png')
+        plt.savefig(path, dpi=300, bbox_inches='tight')
         plt.close()
+        return path
     else:
         plt.show()
 
 
-def generate_visualizations(df: pd.DataFrame, target_col: str, save_path: Optional[str] = "visualizations"):
-    """Generate all visualizations and save them to a directory."""
+def generate_visualizations(df: pd.DataFrame, target_col: str, save_path: Optional[str] = "visualizations",
+                            insights: Optional[dict] = None):
+    """
+    Generate all visualizations and save them to a directory.
+
+    With ``insights`` from ``full_eda``, the missing-value and top-feature
+    plots are drawn from those full-data aggregates, so ``df`` may be a row
+    sample that only feeds the distribution plots.
+
+    Returns:
+        list: Paths of the plot files written by this call
+    """
     if save_path:
         os.makedirs(save_path, exist_ok=True)
 
     print("Generating visualizations...")
 
+    saved = []
+
     # 1. Missing values plot
-    plot_missing_values(df, save_path)
+    saved.append(plot_missing_values(df, save_path,
+                                     missing_pct=insights["missing"] if insights else None))
 
     # 2. Target distribution plot
-    plot_target_distribution(df, target_col, save_path)
+    saved.append(plot_target_distribution(df, target_col, save_path))
 
     # 3. Correlation heatmap
-    plot_correlation_heatmap(df, target_col, save_path)
+    saved.append(plot_correlation_heatmap(df, target_col, save_path))
 
     # 4. Top features plot
-    if df[target_col].dtype in ['int64', 'float64']:
+    if insights is not None:
+        if not insights["correlation"].empty:
+            saved.append(plot_top_features(insights["correlation"], target_col, save_path))
+    elif df[target_col].dtype in ['int64', 'float64']:
         numeric_df = df.select_dtypes(include=['number'])
         if target_col in numeric_df.columns:
             correlations = numeric_df.corr()[target_col]
-            plot_top_features(correlations, target_col, save_path)
+            saved.append(plot_top_features(correlations, target_col, save_path))
 
     # 5. Categorical relationships plot
-    plot_categorical_relationships(df, target_col, save_path)
+    saved.append(plot_categorical_relationships(df, target_col, save_path))
 
     # 6. Outliers plot
-    plot_outliers(df, target_col, save_path)
+    saved.append(plot_outliers(df, target_col, save_path))
 
     if save_path:
         print(f"All visualizations saved to '{save_path}' directory.")
     else:
-        print("Visualization generation complete.")
\ No newline at end of file
+        print("Visualization generation complete.")
+    return [path for path in saved if path]
\ No newline at end of file